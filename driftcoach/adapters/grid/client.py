@@ -3,7 +3,8 @@ import logging
 import time
 import json
 import hashlib
-from typing import Dict, Any, Tuple
+import functools
+from typing import Dict, Any, Tuple, Optional
 
 import requests
 
@@ -70,14 +71,108 @@ _response_cache = _ResponseCache()
 
 def clear_response_cache() -> None:
     _response_cache.clear()
+    _persisted_queries.clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class _PersistedQueries:
+    """Automatic Persisted Queries (APQ) bookkeeping.
+
+    Opt-in with GRID_APQ=1. A query is sent in full (with its sha256 hash) the
+    first time; once the server has accepted it, later calls send only the hash
+    plus variables. If the server reports PersistedQueryNotSupported, APQ is
+    switched off for the process.
+    """
+
+    def __init__(self) -> None:
+        self.registered: set = set()
+        self.supported = True
+
+    def enabled(self) -> bool:
+        return self.supported and os.getenv("GRID_APQ") == "1"
+
+    def clear(self) -> None:
+        self.registered.clear()
+        self.supported = True
+
+
+_persisted_queries = _PersistedQueries()
+
+
+def _request_body(
+    query: Optional[str],
+    variables: Dict[str, Any],
+    extensions: Optional[Dict[str, Any]],
+    apq_hash: Optional[str],
+) -> Dict[str, Any]:
+    body: Dict[str, Any] = {"variables": variables}
+    if query is not None:
+        body["query"] = query
+    ext = dict(extensions or {})
+    if apq_hash:
+        ext["persistedQuery"] = {"version": 1, "sha256Hash": apq_hash}
+    if ext:
+        body["extensions"] = ext
+    return body
+
+
+def _json_or_none(resp: requests.Response) -> Any:
+    try:
+        return resp.json()
+    except ValueError:
+        return None
+
+
+def _apq_error(data: Any) -> Optional[str]:
+    if not isinstance(data, dict) or not data.get("errors"):
+        return None
+    err_str = str(data.get("errors"))
+    if "PersistedQueryNotSupported" in err_str:
+        return "not_supported"
+    if "PersistedQueryNotFound" in err_str:
+        return "not_found"
+    return None
 
 
 class GridClient:
     def __init__(self, api_key: str):
         self.api_key = api_key
 
-    def run_query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
-        """Pure IO: run GraphQL query with global/run budgets and circuit breaker. No retry."""
+    def _post(self, body: Dict[str, Any], headers: Dict[str, str]) -> requests.Response:
+        mark_call_sent()
+        resp = requests.post(
+            GRID_ENDPOINT,
+            json=body,
+            headers=headers,
+            timeout=30,
+        )
+        logger.debug(
+            "GRID request",
+            extra={
+                "endpoint": GRID_ENDPOINT,
+                "status_code": resp.status_code,
+                "body_preview": resp.text[:200],
+            },
+        )
+        return resp
+
+    def run_query(
+        self,
+        query: str,
+        variables: Dict[str, Any],
+        extensions: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Pure IO: run GraphQL query with global/run budgets and circuit breaker. No retry.
+
+        With APQ on, queries go out as hash + variables once the server has seen
+        them. A PersistedQueryNotFound / NotSupported answer costs at most one
+        resend with the full query text, and that resend takes its own rate/run
+        budget like any other call.
+        """
         circuit = get_circuit()
         budget = get_rate_budget()
         run_budget = get_run_budget()
@@ -93,7 +188,7 @@ class GridClient:
             "x-api-key": self.api_key,
             "Content-Type": "application/json",
         }
-        body = {"query": query, "variables": variables}
+        apq_hash = _query_hash(query) if _persisted_queries.enabled() else None
 
         cached, cached_err = _response_cache.get(query, variables)
         if cached_err:
@@ -113,21 +208,22 @@ class GridClient:
             raise GridCircuitOpen("grid_fault_eof")
 
         try:
-            mark_call_sent()
-            resp = requests.post(
-                GRID_ENDPOINT,
-                json=body,
-                headers=headers,
-                timeout=30,
-            )
-            logger.debug(
-                "GRID request",
-                extra={
-                    "endpoint": GRID_ENDPOINT,
-                    "status_code": resp.status_code,
-                    "body_preview": resp.text[:200],
-                },
-            )
+            hash_only = bool(apq_hash) and apq_hash in _persisted_queries.registered
+            resp = self._post(_request_body(None if hash_only else query, variables, extensions, apq_hash), headers)
+            apq_err = _apq_error(_json_or_none(resp)) if apq_hash else None
+            if apq_err == "not_supported" or (apq_err == "not_found" and hash_only):
+                if apq_err == "not_supported":
+                    _persisted_queries.supported = False
+                    apq_hash = None
+                else:
+                    _persisted_queries.registered.discard(apq_hash)
+                # the resend is a second Grid call: it goes through the budgets too
+                mark_call_attempted()
+                circuit.check()
+                if run_budget:
+                    run_budget.acquire()
+                budget.acquire()
+                resp = self._post(_request_body(query, variables, extensions, apq_hash), headers)
             resp.raise_for_status()
             data = resp.json()
             if isinstance(data, dict) and data.get("errors"):
@@ -138,9 +234,11 @@ class GridClient:
                 _response_cache.set_error(query, variables, f"schema_error:{err_str}")
                 raise RuntimeError(f"GRID GraphQL errors: {data.get('errors')}")
             _response_cache.set(query, variables, data)
+            if apq_hash and _persisted_queries.supported:
+                _persisted_queries.registered.add(apq_hash)
             circuit.record_success()
             return data
-        except GridRateExceeded:
+        except (GridRateExceeded, GridRunBudgetExceeded, GridCircuitOpen):
             raise
         except (requests.exceptions.SSLError, requests.exceptions.ConnectionError) as exc:
             circuit.record_failure(None, exc)
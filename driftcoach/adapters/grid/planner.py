@@ -1,10 +1,12 @@
 import datetime as dt
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
-from .client import GridClient
+from .client import GRID_ENDPOINT, GridClient
 from .file_download_client import load_series_events
 
 
@@ -16,6 +18,12 @@ MAX_STEPS = 6
 ALLSERIES_LIMIT = 200
 WINDOW_DAYS = 90
 WINDOW_EXPANSION_DAYS = 180
+INTROSPECTION_TTL_SECONDS = 3600.0
+
+# Process-wide introspection result: endpoint -> (fetched_at, series_fields, query_fields).
+# Reads are lock-free; the lock only serializes refreshes.
+_INTROSPECTION_CACHE: Dict[str, Tuple[float, frozenset, frozenset]] = {}
+_INTROSPECTION_LOCK = threading.Lock()
 
 
 @dataclass
@@ -76,6 +84,33 @@ def _extract_field_set(resp: Dict[str, Any], key: str) -> set:
     return {f.get("name") for f in names if isinstance(f, dict) and f.get("name")}
 
 
+def _cached_introspection() -> Optional[Tuple[frozenset, frozenset]]:
+    entry = _INTROSPECTION_CACHE.get(GRID_ENDPOINT)
+    if entry and time.monotonic() - entry[0] < INTROSPECTION_TTL_SECONDS:
+        return entry[1], entry[2]
+    return None
+
+
+def _load_introspection(run) -> Tuple[frozenset, frozenset]:
+    cached = _cached_introspection()
+    if cached:
+        return cached
+    # The fetch (up to the 30s Grid timeout) runs outside the lock so concurrent
+    # plans never queue behind it; only the cache write is serialized.
+    introspection = run(_introspection_query(), {})
+    series_fields = frozenset(_extract_field_set(introspection, "seriesType"))
+    query_fields = frozenset(_extract_field_set(introspection, "queryType"))
+    if series_fields or query_fields:
+        # an empty field set means a failed/partial introspection: retry next plan
+        with _INTROSPECTION_LOCK:
+            _INTROSPECTION_CACHE[GRID_ENDPOINT] = (time.monotonic(), series_fields, query_fields)
+    return series_fields, query_fields
+
+
+def invalidate_introspection_cache() -> None:
+    _INTROSPECTION_CACHE.clear()
+
+
 def _build_series_selection(series_fields: set) -> str:
     parts = ["id"]
     if "title" in series_fields:
@@ -148,16 +183,10 @@ def execute_plan(plan: Plan, client: GridClient) -> Dict[str, Any]:
         cache[key] = resp
         return resp
 
-    # Step 0: introspection
-    intro_query = _introspection_query()
+    # Step 0: introspection (shared across plans until the TTL lapses)
+    intro_fallback = False
     try:
-        introspection = run(intro_query, {})
-        series_fields = _extract_field_set(introspection, "seriesType")
-        query_fields = _extract_field_set(introspection, "queryType")
-        facts["introspection"] = {
-            "series_fields": sorted(series_fields),
-            "query_fields": sorted(query_fields),
-        }
+        series_fields, query_fields = _load_introspection(run)
     except Exception as exc:  # pragma: no cover
         facts["introspection_error"] = str(exc)
         # Fallback assumptions to proceed
@@ -169,21 +198,33 @@ def execute_plan(plan: Plan, client: GridClient) -> Dict[str, Any]:
             "teams",
         }
         query_fields = {"series", "allSeries", "player"}
+        intro_fallback = True
+    # Sorted copies are only for the log line; otherwise keep the sets as-is.
+    if logger.isEnabledFor(logging.INFO):
         facts["introspection"] = {
             "series_fields": sorted(series_fields),
             "query_fields": sorted(query_fields),
-            "fallback": True,
         }
-    logger.info(
-        "[INTROSPECT] series_fields=%s query_fields=%s fallback=%s",
-        facts["introspection"].get("series_fields"),
-        facts["introspection"].get("query_fields"),
-        facts["introspection"].get("fallback", False),
-    )
+        logger.info(
+            "[INTROSPECT] series_fields=%s query_fields=%s fallback=%s",
+            facts["introspection"]["series_fields"],
+            facts["introspection"]["query_fields"],
+            intro_fallback,
+        )
+    else:
+        facts["introspection"] = {"series_fields": series_fields, "query_fields": query_fields}
+    if intro_fallback:
+        facts["introspection"]["fallback"] = True
 
     # Step 1: Anchor series
     series_query = _series_anchor_query(series_fields)
-    anchor_resp = run(series_query, {"id": plan.series_id})
+    try:
+        anchor_resp = run(series_query, {"id": plan.series_id})
+    except Exception as exc:
+        if "FieldUndefined" in str(exc) or "Cannot query field" in str(exc):
+            # Schema drifted under the cached introspection; refetch on the next plan.
+            invalidate_introspection_cache()
+        raise
     anchor_series = (anchor_resp.get("data", {}) or {}).get("series") or {}
     games = anchor_series.get("games") or []
     logger.info(
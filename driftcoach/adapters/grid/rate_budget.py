@@ -117,17 +117,22 @@ class CircuitBreaker:
         self._lock = threading.Lock()
 
     def check(self) -> None:
+        # Unlocked read is safe for the CLOSED fast path; only OPEN needs the lock to transition.
+        if self.state == "CLOSED":
+            return
         with self._lock:
             if self.state == "OPEN" and time.time() < self.open_until:
                 _inc_counter("circuit_open_denied")
                 raise GridCircuitOpen(self.last_reason or "grid_circuit_open")
-            if self.state == "OPEN" and time.time() >= self.open_until:
+            if self.state == "OPEN":
                 # allow traffic again
                 self.state = "CLOSED"
                 self.consecutive_429 = 0
                 self.last_reason = None
 
     def record_success(self) -> None:
+        if self.consecutive_429 == 0 and self.state != "OPEN" and self.last_reason is None:
+            return
         with self._lock:
             self.consecutive_429 = 0
             if self.state != "OPEN":
@@ -192,6 +197,7 @@ def get_circuit() -> CircuitBreaker:
 def grid_health_snapshot() -> dict:
     cb = get_circuit()
     rb = get_rate_budget()
+    run_budget = get_run_budget()
     counters = get_debug_counters()
     return {
         "circuit_state": cb.state,
@@ -199,6 +205,6 @@ def grid_health_snapshot() -> dict:
         "circuit_reason": cb.last_reason,
         "global_remaining": rb.remaining,
         "global_reset_at": rb.reset_at,
-        "run_budget_remaining": (get_run_budget().max_requests - get_run_budget().used) if get_run_budget() else None,
+        "run_budget_remaining": (run_budget.max_requests - run_budget.used) if run_budget else None,
         "debug_counters": counters,
     }
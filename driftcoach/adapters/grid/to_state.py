@@ -1,24 +1,64 @@
 import datetime as dt
-import logging
+import functools
+import re
+from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple
 
 from driftcoach.core.state import State
 
-logger = logging.getLogger(__name__)
+ActionTag = str
 
+# Anchor context slices and their provenance; the provenance dict is shared by
+# every anchor state (nothing downstream mutates extras["provenance"]).
+_ANCHOR_SLICES: Tuple[Tuple[int, str], ...] = (
+    (0, "FORMAT_CONTEXT"),
+    (1, "TOURNAMENT_CONTEXT"),
+    (2, "SCHEDULE_CONTEXT"),
+    (3, "OPPONENT_CONTEXT"),
+)
+_ANCHOR_PROV: Dict[str, Any] = {"step_ids": ["anchor"], "fields_used": ["series"], "aggregation_level": "series"}
 
-ActionTag = str
 
+# GRID timestamps: "2024-05-01T12:00:00Z" / "...T12:00:00.123+02:00"
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:?\d{2})?"
+)
 
-def _to_ts(value: Any) -> float:
-    if not value:
-        return 0.0
+
+@functools.lru_cache(maxsize=1024)
+def _iso_ts(text: str) -> float:
+    m = _ISO_RE.fullmatch(text)
     try:
-        return dt.datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+        if m is None:
+            return dt.datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp()
+        year, month, day, hour, minute, second, frac, tz = m.groups()
+        tzinfo = None
+        if tz == "Z":
+            tzinfo = dt.timezone.utc
+        elif tz:
+            sign = -1 if tz[0] == "-" else 1
+            tz_digits = tz[1:].replace(":", "")
+            tzinfo = dt.timezone(sign * dt.timedelta(hours=int(tz_digits[:2]), minutes=int(tz_digits[2:])))
+        return dt.datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(frac.ljust(6, "0")) if frac else 0,
+            tzinfo=tzinfo,
+        ).timestamp()
     except Exception:
         return 0.0
 
 
+def _to_ts(value: Any) -> float:
+    if not value:
+        return 0.0
+    return _iso_ts(str(value))
+
+
 def _format_name(series: Dict[str, Any]) -> Optional[str]:
     fmt = series.get("format")
     if isinstance(fmt, dict):
@@ -37,57 +77,54 @@ def _tournament_name(series: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+_EMPTY: Dict[str, Any] = {}
+
+
 def _team_ids(series: Dict[str, Any]) -> List[str]:
-    teams = series.get("teams") or []
     ids: List[str] = []
-    for t in teams:
-        base = t.get("baseInfo") or {}
-        if base.get("id"):
-            ids.append(str(base.get("id")))
+    for t in series.get("teams") or ():
+        bid = (t.get("baseInfo") or _EMPTY).get("id")
+        if bid:
+            ids.append(str(bid))
     return ids
 
 
-def _team_names(series: Dict[str, Any]) -> List[str]:
-    teams = series.get("teams") or []
-    names: List[str] = []
-    for t in teams:
-        base = t.get("baseInfo") or {}
-        if base.get("name"):
-            names.append(str(base.get("name")))
-    return names
-
-
-def _action_tags(series: Dict[str, Any]) -> List[ActionTag]:
+@functools.lru_cache(maxsize=256)
+def _action_tags_from(fmt_lower: str, tourn_lower: str) -> Tuple[ActionTag, ...]:
+    """Tags for a (format, tournament) pair; cached, so series sharing labels share one tuple."""
     tags: List[ActionTag] = []
-    fmt = (_format_name(series) or "").lower()
-    if "bo1" in fmt:
+    if "bo1" in fmt_lower:
         tags.append("PLAY_BO1")
-    if "bo3" in fmt or "best of 3" in fmt:
+    if "bo3" in fmt_lower or "best of 3" in fmt_lower:
         tags.append("PLAY_BO3")
 
-    tourn = (_tournament_name(series) or "").lower()
-    if "playoff" in tourn or "final" in tourn:
+    if "playoff" in tourn_lower or "final" in tourn_lower:
         tags.append("PLAYOFF")
-    elif tourn:
+    elif tourn_lower:
         tags.append("REGULAR_SEASON")
 
-    return tags
+    return tuple(tags)
 
 
-def _bucket_key(series: Dict[str, Any]) -> str:
-    fmt = (_format_name(series) or "").lower()
-    if "bo3" in fmt:
+def _action_tags(series: Dict[str, Any]) -> Tuple[ActionTag, ...]:
+    return _action_tags_from((_format_name(series) or "").lower(), (_tournament_name(series) or "").lower())
+
+
+def _bucket_key_from(fmt_lower: str) -> str:
+    if "bo3" in fmt_lower:
         return "BO3"
-    if "bo1" in fmt:
+    if "bo1" in fmt_lower:
         return "BO1"
     return "OTHER"
 
 
+def _bucket_key(series: Dict[str, Any]) -> str:
+    return _bucket_key_from((_format_name(series) or "").lower())
+
+
 def _outcome(series: Dict[str, Any]) -> Optional[str]:
     if series.get("winner"):
         return "WIN"
-    if isinstance(series.get("winner"), str) and series.get("winner"):
-        return "WIN"
     result = series.get("result") or series.get("outcome")
     if isinstance(result, str):
         res = result.lower()
@@ -95,13 +132,14 @@ def _outcome(series: Dict[str, Any]) -> Optional[str]:
             return "WIN"
         if "loss" in res or "lose" in res:
             return "LOSS"
-    teams = series.get("teams") or []
-    if len(teams) >= 2:
-        scores = [t.get("score") for t in teams]
-        if all(isinstance(s, (int, float)) for s in scores):
-            if scores[0] > scores[1]:
+    teams = series.get("teams")
+    if teams and len(teams) >= 2:
+        s0 = teams[0].get("score")
+        s1 = teams[1].get("score")
+        if isinstance(s0, (int, float)) and isinstance(s1, (int, float)):
+            if s0 > s1:
                 return "WIN"
-            if scores[0] < scores[1]:
+            if s0 < s1:
                 return "LOSS"
     return None
 
@@ -113,7 +151,12 @@ def _make_state(
     outcome: Optional[str],
     player_id: str,
     provenance: Dict[str, Any],
+    labels: Optional[Tuple[Optional[str], Optional[str]]] = None,
+    extra_extras: Optional[Dict[str, Any]] = None,
 ) -> State:
+    """``labels`` is the (format, tournament) pair when the caller already resolved it;
+    ``extra_extras`` is merged into extras before the State is built."""
+    fmt, tourn = labels if labels is not None else (_format_name(series), _tournament_name(series))
     sid = series.get("id", "unknown")
     state_id = f"{evidence_type}_{idx:03d}"
     timestamp = _to_ts(series.get("startTimeScheduled") or series.get("startTime"))
@@ -124,12 +167,14 @@ def _make_state(
         "player_id": player_id,
         "series_id": sid,
         "team_ids": _team_ids(series),
-        "tournament": _tournament_name(series),
-        "format": _format_name(series),
+        "tournament": tourn,
+        "format": fmt,
         "start_time": series.get("startTimeScheduled") or series.get("startTime"),
-        "action_tags": _action_tags(series),
+        "action_tags": _action_tags_from((fmt or "").lower(), (tourn or "").lower()),
         "provenance": provenance,
     }
+    if extra_extras:
+        extras.update(extra_extras)
     return State(
         state_id=state_id,
         series_id=str(sid),
@@ -156,27 +201,39 @@ def build_states(
     team_stats_info: Optional[Dict[str, Any]] = None,
 ) -> Tuple[List[State], Dict[str, Any]]:
     states: List[State] = []
+    next_idx = 0  # == len(states), kept as a plain counter
 
     # Anchor fixed slices
-    anchor_prov = {"step_ids": ["anchor"], "fields_used": ["series"], "aggregation_level": "series"}
-    for idx, ev_type in enumerate(["FORMAT_CONTEXT", "TOURNAMENT_CONTEXT", "SCHEDULE_CONTEXT", "OPPONENT_CONTEXT"]):
-        states.append(_make_state(idx, ev_type, anchor_series, None, player_id, anchor_prov))
+    anchor_labels = (_format_name(anchor_series), _tournament_name(anchor_series))
+    for idx, ev_type in _ANCHOR_SLICES:
+        states.append(_make_state(idx, ev_type, anchor_series, None, player_id, _ANCHOR_PROV, anchor_labels))
+        next_idx += 1
 
-    # Series pool slices
+    # Series pool slices (format/tournament resolved once per series, buckets counted alongside)
+    bucket_keys: List[str] = []
     for idx, series in enumerate(series_pool):
         outcome_val = _outcome(series)
         ev_type = "SERIES_OUTCOME" if outcome_val else "CONTEXT_ONLY"
         prov = {"step_ids": ["pool"], "fields_used": [outcome_field or "unknown"], "aggregation_level": "series"}
-        states.append(_make_state(idx, ev_type, series, outcome_val, player_id, prov))
+        labels = (_format_name(series), _tournament_name(series))
+        bucket_keys.append(_bucket_key_from((labels[0] or "").lower()))
+        states.append(_make_state(idx, ev_type, series, outcome_val, player_id, prov, labels))
+        next_idx += 1
 
     # Aggregated performance (best-effort placeholder)
+    agg_states_count = 0
+
     def _add_aggregation_state(level: str, info: Optional[Dict[str, Any]]):
+        nonlocal agg_states_count, next_idx
         if info is None:
             return
-        data = info.get("data") if isinstance(info, dict) else None
-        reason = info.get("reason") if isinstance(info, dict) else "unknown"
-        query_name = info.get("query_name") if isinstance(info, dict) else None
-        agg_ids = info.get("aggregation_series_ids") if isinstance(info, dict) else None
+        if isinstance(info, dict):
+            reason = info.get("reason")
+        else:
+            info, reason = _EMPTY, "unknown"
+        data = info.get("data")
+        query_name = info.get("query_name")
+        agg_ids = info.get("aggregation_series_ids") or []
 
         available = bool(data)
         perf_series = {
@@ -189,53 +246,50 @@ def build_states(
             "step_ids": [f"{level}_stats"],
             "fields_used": [query_name or f"{level}Statistics"],
             "aggregation_level": level,
-            "aggregationSeriesIds": agg_ids or [],
+            "aggregationSeriesIds": agg_ids,
+        }
+        agg_extras = {
+            "aggregation_level": level,
+            "aggregation_unavailable": not available,
+            "aggregation_reason": reason,
+            "aggregation_series_ids": agg_ids,
         }
-        state = _make_state(len(states), "AGGREGATED_PERFORMANCE", perf_series, None, player_id, prov)
-        state.extras.update(
-            {
-                "aggregation_level": level,
-                "aggregation_unavailable": not available,
-                "aggregation_reason": reason,
-                "aggregation_series_ids": agg_ids or [],
-            }
-        )
         if isinstance(data, dict):
-            state.extras["aggregation_raw"] = data
-        states.append(state)
+            agg_extras["aggregation_raw"] = data
+        states.append(
+            _make_state(
+                next_idx,
+                "AGGREGATED_PERFORMANCE",
+                perf_series,
+                None,
+                player_id,
+                prov,
+                extra_extras=agg_extras,
+            )
+        )
+        agg_states_count += 1
+        next_idx += 1
 
     _add_aggregation_state("team", team_stats_info)
     _add_aggregation_state("player", player_stats_info)
 
-    aggregation_available = any(
-        (
-            isinstance(team_stats_info, dict) and team_stats_info.get("data"),
-            isinstance(player_stats_info, dict) and player_stats_info.get("data"),
-        )
-    )
+    team_info = team_stats_info if isinstance(team_stats_info, dict) else _EMPTY
+    player_info = player_stats_info if isinstance(player_stats_info, dict) else _EMPTY
+    team_has = bool(team_info.get("data"))
+    player_has = bool(player_info.get("data"))
 
     # Metrics for evidence context
-    bucket_counts: Dict[str, int] = {}
-    for s in series_pool:
-        key = _bucket_key(s)
-        bucket_counts[key] = bucket_counts.get(key, 0) + 1
-
+    bucket_counts = dict(Counter(bucket_keys))
     evidence_meta = {
-        "states": len(states),
+        "states": next_idx,
         "seriesPool": len(series_pool),
         "buckets": bucket_counts,
         "roster_proxy": roster_proxy,
-        "aggregation_available": bool(aggregation_available),
+        "aggregation_available": team_has or player_has,
         "aggregation_meta": {
-            "team": {
-                "available": bool(team_stats_info and team_stats_info.get("data")),
-                "reason": (team_stats_info or {}).get("reason"),
-            },
-            "player": {
-                "available": bool(player_stats_info and player_stats_info.get("data")),
-                "reason": (player_stats_info or {}).get("reason"),
-            },
-            "aggregated_states": len([s for s in states if s.extras.get("evidence_type") == "AGGREGATED_PERFORMANCE"]),
+            "team": {"available": team_has, "reason": team_info.get("reason")},
+            "player": {"available": player_has, "reason": player_info.get("reason")},
+            "aggregated_states": agg_states_count,
         },
     }
 
@@ -248,12 +302,23 @@ def build_states(
     return states, {"schema": schema_ctx, "evidence": evidence_meta}
 
 
-# Deprecated legacy aliases for compatibility
-def games_to_states(_: List[Dict[str, Any]]):  # pragma: no cover
-    logger.warning("games_to_states deprecated under central-data path; use build_states")
-    return []
+# Deprecated legacy aliases for compatibility, resolved lazily on first access
+_DEPRECATED_STUBS = {
+    "games_to_states": "games_to_states deprecated under central-data path; use build_states",
+    "series_to_states": "series_to_states is deprecated; use build_states",
+}
+
+
+def __getattr__(name: str):
+    message = _DEPRECATED_STUBS.get(name)
+    if message is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import logging
 
+    def _deprecated(*_args: Any, **_kwargs: Any):  # pragma: no cover
+        logging.getLogger(__name__).warning(message)
+        return []
 
-def series_to_states(series_payload: Dict[str, Any], stats_payload: Dict[str, Any]):  # pragma: no cover
-    logger.warning("series_to_states is deprecated; use build_states")
-    return []
+    _deprecated.__name__ = name
+    return _deprecated
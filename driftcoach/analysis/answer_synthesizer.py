@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Dict, List, Literal, Any
+from typing import Dict, List, Literal, Any, Optional
 
 from driftcoach.config.bounds import (
     SystemBounds,
@@ -11,7 +12,12 @@ from driftcoach.config.bounds import (
 )
 
 
-@dataclass
+# note tokens look like "opening_team=A, winner=B loser_kills=3"
+_NOTE_OPENING_RE = re.compile(r"(?:^|[\s,])opening_team=([^\s,=]+)", re.IGNORECASE)
+_NOTE_WINNER_RE = re.compile(r"(?:^|[\s,])winner=([^\s,=]+)", re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class AnswerInput:
     question: str
     intent: str
@@ -20,7 +26,7 @@ class AnswerInput:
     series_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerSynthesisResult:
     claim: str
     verdict: Literal["YES", "NO", "INSUFFICIENT"]
@@ -31,19 +37,37 @@ class AnswerSynthesisResult:
 
 
 def _fmt_fact(fact: Dict[str, Any]) -> str:
-    note = fact.get("note") or ""
-    rr = fact.get("round_range") or []
+    get = fact.get
+    note = get("note") or ""
+    rr = get("round_range") or ()
     rr_str = f"R{rr[0]}-R{rr[1]}" if len(rr) == 2 else ""
-    gi = fact.get("game_index")
+    gi = get("game_index")
     game_str = f"G{gi}" if gi is not None else ""
-    pieces = [p for p in [game_str, rr_str, note] if p]
-    return " | ".join(pieces) or fact.get("fact_type") or "fact"
+    if game_str and rr_str:
+        return f"{game_str} | {rr_str} | {note}" if note else f"{game_str} | {rr_str}"
+    head = game_str or rr_str
+    if head:
+        return f"{head} | {note}" if note else head
+    return note or get("fact_type") or "fact"
+
+
+def _fmt_fact_cached(fact: Dict[str, Any], cache: Optional[Dict[int, str]]) -> str:
+    """Format a fact once per synthesis; ``cache`` is keyed by ``id(fact)`` and
+    must not outlive the facts it describes."""
+    if cache is None:
+        return _fmt_fact(fact)
+    key = id(fact)
+    text = cache.get(key)
+    if text is None:
+        text = cache[key] = _fmt_fact(fact)
+    return text
 
 
 def _support_strings(
     facts: List[Dict[str, Any]],
     limit: int = None,
     bounds: SystemBounds = DEFAULT_BOUNDS,
+    cache: Optional[Dict[int, str]] = None,
 ) -> List[str]:
     """
     Format facts into support strings, respecting hard bounds.
@@ -52,22 +76,21 @@ def _support_strings(
         facts: List of fact dictionaries
         limit: Optional explicit limit (overrides bounds if provided)
         bounds: System bounds to enforce
+        cache: Optional per-synthesis format cache (see _fmt_fact_cached)
 
     Returns:
         List of formatted fact strings
     """
     if limit is None:
         limit = bounds.max_support_facts
-    out: List[str] = []
-    for f in facts[:limit]:
-        out.append(_fmt_fact(f))
-    return out
+    return [_fmt_fact_cached(f, cache) for f in facts[:limit]]
 
 
 def _counter_strings(
     facts: List[Dict[str, Any]],
     limit: int = None,
     bounds: SystemBounds = DEFAULT_BOUNDS,
+    cache: Optional[Dict[int, str]] = None,
 ) -> List[str]:
     """
     Format counter-fact strings, respecting hard bounds.
@@ -76,6 +99,7 @@ def _counter_strings(
         facts: List of counter-fact dictionaries (or string messages)
         limit: Optional explicit limit (overrides bounds if provided)
         bounds: System bounds to enforce
+        cache: Optional per-synthesis format cache (see _fmt_fact_cached)
 
     Returns:
         List of formatted counter-fact strings
@@ -84,13 +108,7 @@ def _counter_strings(
         limit = bounds.max_counter_facts
 
     # Handle both dict facts and string messages
-    out: List[str] = []
-    for f in facts[:limit]:
-        if isinstance(f, dict):
-            out.append(_fmt_fact(f))
-        else:
-            out.append(str(f))
-    return out
+    return [_fmt_fact_cached(f, cache) if isinstance(f, dict) else str(f) for f in facts[:limit]]
 
 
 def _limit_followups(
@@ -104,13 +122,25 @@ def _limit_followups(
 def _swings_across_segments(swings: List[Dict[str, Any]]) -> bool:
     if not swings:
         return False
-    game_indices = {f.get("game_index") for f in swings if f.get("game_index") is not None}
-    if len(game_indices) >= 2:
-        return True
-    rounds = [r for f in swings for r in (f.get("round_range") or []) if isinstance(r, int)]
-    if not rounds:
+    # One pass: stop as soon as two games are seen, otherwise track the round span.
+    first_game = None
+    rmin = rmax = None
+    for f in swings:
+        gi = f.get("game_index")
+        if gi is not None:
+            if first_game is None:
+                first_game = gi
+            elif gi != first_game:
+                return True
+        for r in f.get("round_range") or ():
+            if isinstance(r, int):
+                if rmin is None or r < rmin:
+                    rmin = r
+                if rmax is None or r > rmax:
+                    rmax = r
+    if rmin is None:
         return False
-    return max(rounds) - min(rounds) >= 3 and len(swings) >= 3
+    return rmax - rmin >= 3 and len(swings) >= 3
 
 
 def _swing_changes_winner(fact: Dict[str, Any]) -> bool:
@@ -118,15 +148,13 @@ def _swing_changes_winner(fact: Dict[str, Any]) -> bool:
     winner = fact.get("winner") or fact.get("winning_team")
     if opening and winner:
         return str(opening) != str(winner)
-    note = (fact.get("note") or "").lower()
-    if "opening_team=" in note and "winner=" in note:
-        try:
-            segs = {kv.split("=")[0]: kv.split("=")[1] for kv in note.replace(",", " ").split() if "=" in kv}
-            if segs.get("opening_team") and segs.get("winner"):
-                return segs["opening_team"] != segs["winner"]
-        except Exception:
-            pass
-    if "loser_kills" in note:
+    note = fact.get("note") or ""
+    opening_m = _NOTE_OPENING_RE.search(note)
+    if opening_m:
+        winner_m = _NOTE_WINNER_RE.search(note)
+        if winner_m:
+            return opening_m.group(1).lower() != winner_m.group(1).lower()
+    if "loser_kills" in note.lower():
         return True
     return False
 
@@ -141,30 +169,19 @@ def synthesize_answer(
     This wrapper maintains backward compatibility while using the new handler-based architecture
     that integrates Spec contracts for filtering facts by intent.
     """
-    from driftcoach.analysis.synthesizer_router import AnswerSynthesizer
+    from driftcoach.analysis.synthesizer_router import default_synthesizer
 
-    synthesizer = AnswerSynthesizer()
-    return synthesizer.synthesize(inp, bounds=bounds)
+    return default_synthesizer().synthesize(inp, bounds=bounds)
 
 
 def render_answer(result: AnswerSynthesisResult) -> str:
-    support = result.support_facts or ["无"]
-    counter = result.counter_facts or ["无"]
-    followups = result.followups or ["无"]
-    lines = [
-        "【结论】",
-        result.claim,
-        "",
-        "【依据】",
-        *(f"- {s}" for s in support),
-        "",
-        "【不确定性 / 反例】",
-        *(f"- {c}" for c in counter),
-        "",
-        "【置信度】",
-        str(result.confidence),
-        "",
-        "【可继续追问】",
-        *(f"- {f}" for f in followups),
-    ]
+    support = result.support_facts or ("无",)
+    counter = result.counter_facts or ("无",)
+    followups = result.followups or ("无",)
+    lines = ["【结论】", result.claim, "", "【依据】"]
+    lines += [f"- {s}" for s in support]
+    lines += ["", "【不确定性 / 反例】"]
+    lines += [f"- {c}" for c in counter]
+    lines += ["", "【置信度】", str(result.confidence), "", "【可继续追问】"]
+    lines += [f"- {f}" for f in followups]
     return "\n".join(lines)
@@ -25,15 +25,21 @@ Confidence is the engineering mapping of expectation.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import List
+from itertools import islice
+from typing import Deque, Optional
+
+
+DEFAULT_CONVERGENCE_EPSILON = 0.05
+DEFAULT_CONVERGENCE_WINDOW = 3
 
 
 # =============================================================================
 # 1. BudgetState (Current State of Mining Process)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BudgetState:
     """
     Current state of the fact-mining process.
@@ -41,13 +47,19 @@ class BudgetState:
     Attributes:
         current_confidence: Current estimated confidence (E[I{A}])
         remaining_budget: Remaining mining steps (from L3 bounds)
-        confidence_history: History of confidence values (for convergence check)
+        confidence_history: Recent confidence values (bounded; for convergence check)
         facts_mined: Number of facts already mined
+        convergence_epsilon: ε used to maintain small_delta_streak
+        small_delta_streak: Consecutive trailing updates with |Δ| < ε
+        first_gain: Δ₁, the confidence gained by the first update (None before it)
     """
     current_confidence: float
     remaining_budget: int
-    confidence_history: List[float]
+    confidence_history: Deque[float]
     facts_mined: int = 0
+    convergence_epsilon: float = DEFAULT_CONVERGENCE_EPSILON
+    small_delta_streak: int = 0
+    first_gain: Optional[float] = None
 
     def update_confidence(self, new_confidence: float) -> None:
         """
@@ -56,15 +68,26 @@ class BudgetState:
         Args:
             new_confidence: New confidence value after mining a fact
         """
+        history = self.confidence_history
+        if history:
+            gain = new_confidence - history[-1]
+            if self.first_gain is None:
+                self.first_gain = gain
+            if abs(gain) < self.convergence_epsilon:
+                self.small_delta_streak += 1
+            else:
+                self.small_delta_streak = 0
+        else:
+            self.small_delta_streak = 0
         self.current_confidence = new_confidence
-        self.confidence_history.append(new_confidence)
+        history.append(new_confidence)
 
 
 # =============================================================================
 # 2. ConfidenceTarget (User-Defined Stopping Criteria)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceTarget:
     """
     User-defined confidence target and constraints.
@@ -78,11 +101,14 @@ class ConfidenceTarget:
         min_steps: Minimum steps before allowing early stop (premature stop guard)
         convergence_window: Window size for convergence check (k)
         convergence_epsilon: Threshold for "converged" (ε)
+        gain_ratio_omega: Stop once the last k-1 gains are all <= ω·Δ₁
+            (diminishing returns, ω); None disables the rule
     """
     target_confidence: float
     min_steps: int = 2
-    convergence_window: int = 3
-    convergence_epsilon: float = 0.05
+    convergence_window: int = DEFAULT_CONVERGENCE_WINDOW
+    convergence_epsilon: float = DEFAULT_CONVERGENCE_EPSILON
+    gain_ratio_omega: Optional[float] = None
 
 
 # =============================================================================
@@ -101,6 +127,7 @@ class BudgetController:
         1. Achieved target confidence (most important)
         2. Budget exhausted (L3 constraint)
         3. Confidence converged (Chapter 5 essence)
+        4. Marginal gain exhausted (Δₜ <= ω·Δ₁ over the window; opt-in via ω)
     """
 
     def should_continue(
@@ -119,19 +146,23 @@ class BudgetController:
             state: Current budget state
             target: User-defined confidence target
         """
+        # Rules are a union, so evaluate the cheapest first.
+        # Rule 2: Budget exhausted (L3 constraint) - integer compare
+        if self._is_budget_exhausted(state):
+            return False
+
         # Rule 1: Achieved target confidence (MOST IMPORTANT)
         if self._is_target_achieved(state, target):
             return False
 
-        # Rule 2: Budget exhausted (L3 constraint)
-        if self._is_budget_exhausted(state):
+        # Rule 3: Confidence converged (Chapter 5 essence)
+        # Only stop if we've done minimum steps, so check that before the scan
+        if state.facts_mined >= target.min_steps and self._is_converged(state, target):
             return False
 
-        # Rule 3: Confidence converged (Chapter 5 essence)
-        if self._is_converged(state, target):
-            # Only stop if we've done minimum steps
-            if state.facts_mined >= target.min_steps:
-                return False
+        # Rule 4: Marginal gain exhausted (adaptive, relative to the first gain)
+        if self._is_marginal_gain_exhausted(state, target):
+            return False
 
         # Default: CONTINUE
         return True
@@ -156,6 +187,40 @@ class BudgetController:
         """
         return state.remaining_budget <= 0
 
+    def _is_marginal_gain_exhausted(
+        self,
+        state: BudgetState,
+        target: ConfidenceTarget
+    ) -> bool:
+        """
+        Check if the gains have flattened relative to the first one.
+
+        Rule: 0 < Δ <= ω · Δ₁ for each of the last k-1 gains (only when ω is
+        set, after min_steps, and only when Δ₁ > 0)
+
+        Catches diminishing returns before every delta drops under the
+        absolute ε of Rule 3. Zero gains are plateaus, not diminishing
+        returns: step-shaped confidence tables stall between steps, and
+        Rule 3 already decides when a plateau has lasted long enough.
+        """
+        omega = target.gain_ratio_omega
+        if omega is None or state.facts_mined < target.min_steps:
+            return False
+        first_gain = state.first_gain
+        if first_gain is None or first_gain <= 0:
+            return False
+        history = state.confidence_history
+        window = target.convergence_window
+        if window <= 1 or len(history) < window:
+            return False
+        limit = omega * first_gain
+        recent = list(islice(history, len(history) - window, None))
+        for i in range(1, len(recent)):
+            gain = recent[i] - recent[i-1]
+            if gain <= 0 or gain > limit:
+                return False
+        return True
+
     def _is_converged(
         self,
         state: BudgetState,
@@ -168,16 +233,31 @@ class BudgetController:
 
         This is the ESSENCE of Chapter 5:
         "Stop when marginal gain is negligible."
+
+        A window of one value has no deltas to compare and ε <= 0 can never
+        be undercut, so those configurations never count as converged.
+        Neither does a window the state's bounded history cannot hold; size
+        the state for the target with create_initial_state(target=...).
         """
-        if len(state.confidence_history) < target.convergence_window:
+        if target.convergence_window <= 1 or target.convergence_epsilon <= 0:
+            return False
+
+        # O(1): the state tracks the trailing run of small deltas as it is updated
+        if state.convergence_epsilon == target.convergence_epsilon:
+            return state.small_delta_streak >= target.convergence_window - 1
+
+        history = state.confidence_history
+        window = target.convergence_window
+        if len(history) < window:
             return False
 
         # Get last k confidence values
-        recent = state.confidence_history[-target.convergence_window:]
+        recent = list(islice(history, len(history) - window, None))
+        eps = target.convergence_epsilon
 
         # Check if all changes are < ε
         for i in range(1, len(recent)):
-            if abs(recent[i] - recent[i-1]) >= target.convergence_epsilon:
+            if abs(recent[i] - recent[i-1]) >= eps:
                 return False
 
         return True
@@ -189,7 +269,10 @@ class BudgetController:
 
 def create_initial_state(
     initial_confidence: float = 0.0,
-    budget: int = 5
+    budget: int = 5,
+    convergence_epsilon: float = DEFAULT_CONVERGENCE_EPSILON,
+    convergence_window: int = DEFAULT_CONVERGENCE_WINDOW,
+    target: Optional[ConfidenceTarget] = None
 ) -> BudgetState:
     """
     Create initial BudgetState for a new mining process.
@@ -197,15 +280,23 @@ def create_initial_state(
     Args:
         initial_confidence: Starting confidence (usually 0.0 or 0.3)
         budget: Total mining budget (from L3 bounds)
+        convergence_epsilon: ε of the target this state will be checked against
+        convergence_window: k of that target; sizes the bounded history
+        target: The target itself; when given, its ε and k override the two
+            arguments above so the history always fits the window
 
     Returns:
         Initial BudgetState
     """
+    if target is not None:
+        convergence_epsilon = target.convergence_epsilon
+        convergence_window = target.convergence_window
     return BudgetState(
         current_confidence=initial_confidence,
         remaining_budget=budget,
-        confidence_history=[initial_confidence],
-        facts_mined=0
+        confidence_history=deque([initial_confidence], maxlen=max(16, convergence_window * 2)),
+        facts_mined=0,
+        convergence_epsilon=convergence_epsilon
     )
 
 
@@ -224,6 +315,6 @@ def create_default_target(
     return ConfidenceTarget(
         target_confidence=target_confidence,
         min_steps=2,           # Prevent premature stop
-        convergence_window=3,  # Check last 3 steps
-        convergence_epsilon=0.05  # 5% change threshold
+        convergence_window=DEFAULT_CONVERGENCE_WINDOW,  # Check last 3 steps
+        convergence_epsilon=DEFAULT_CONVERGENCE_EPSILON  # 5% change threshold
     )
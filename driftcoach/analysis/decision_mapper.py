@@ -13,24 +13,51 @@ Core philosophy:
 
 from __future__ import annotations
 
-from enum import Enum
+from collections import Counter
+from enum import IntEnum
 from dataclasses import dataclass
+from itertools import chain
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 
+from driftcoach.analysis.answer_synthesizer import AnswerInput
+from driftcoach.analysis.synthesizer_router import default_synthesizer
+
 logger = logging.getLogger(__name__)
 
 
-class DecisionPath(Enum):
+class DecisionPath(IntEnum):
     """
     Three-way decision path (not binary).
+
+    Ordered by severity, so members compare as plain ints. Values start at
+    1 so every member is truthy; serialize with ``value_str``, which gives
+    the lowercase name that ``.value`` used to hold.
     """
-    STANDARD = "standard"       # Full evidence → normal conclusion
-    DEGRADED = "degraded"       # Partial evidence → degraded conclusion
-    REJECT = "reject"           # No evidence → explicit refusal
+    STANDARD = 1       # Full evidence → normal conclusion
+    DEGRADED = 2       # Partial evidence → degraded conclusion
+    REJECT = 3         # No evidence → explicit refusal
+
+    @property
+    def value_str(self) -> str:
+        return self.name.lower()
+
 
+# [has no facts][uncertainty bucket: <0.4, <0.8, >=0.8]
+_PATH_TABLE = (
+    (DecisionPath.STANDARD, DecisionPath.DEGRADED, DecisionPath.REJECT),
+    (DecisionPath.REJECT, DecisionPath.REJECT, DecisionPath.REJECT),
+)
 
-@dataclass
+# Evidence-driven followups, in the order they are suggested
+_FOLLOWUP_BY_TYPE = {
+    "ROUND_SWING": "深入分析反转回合的战术决策",
+    "HIGH_RISK_SEQUENCE": "回顾高风险回合的经济管理",
+    "FORCE_BUY_ROUND": "评估强起时机和收益",
+}
+
+
+@dataclass(slots=True)
 class UncertaintyMetrics:
     """
     Quantifies the uncertainty in the current context.
@@ -58,7 +85,7 @@ class UncertaintyMetrics:
             return "LOW"
 
 
-@dataclass
+@dataclass(slots=True)
 class CoachingDecision:
     """
     Actionable coaching decision.
@@ -108,14 +135,18 @@ class DecisionMapper:
         Returns:
             Coaching decision
         """
+        # One pass over the fact dict, shared by every step below
+        flat_facts = list(chain.from_iterable(facts.values()))
+        total_facts = len(flat_facts)
+
         # Step 1: Price the uncertainty
-        uncertainty = self._price_uncertainty(context, facts)
+        uncertainty = self._price_uncertainty(context, facts, total_facts)
 
         # Step 2: Choose decision path
-        decision_path = self._choose_decision_path(uncertainty, facts)
+        decision_path = self._choose_decision_path(uncertainty, facts, total_facts)
 
         logger.info(
-            f"[DECISION_MAPPER] intent={intent}, path={decision_path.value}, "
+            f"[DECISION_MAPPER] intent={intent}, path={decision_path.value_str}, "
             f"uncertainty={uncertainty.total:.2f}, severity={uncertainty.severity}"
         )
 
@@ -123,38 +154,40 @@ class DecisionMapper:
         if decision_path == DecisionPath.STANDARD:
             return self._generate_standard_decision(intent, facts, bounds)
         elif decision_path == DecisionPath.DEGRADED:
-            return self._generate_degraded_decision(intent, facts, uncertainty, bounds)
+            return self._generate_degraded_decision(intent, facts, uncertainty, bounds, flat_facts)
         else:
-            return self._generate_rejection(intent, facts, uncertainty)
+            return self._generate_rejection(intent, facts, uncertainty, total_facts)
 
     def _price_uncertainty(
         self,
         context: Dict[str, Any],
-        facts: Dict[str, List[Dict[str, Any]]]
+        facts: Dict[str, List[Dict[str, Any]]],
+        total_facts: Optional[int] = None
     ) -> UncertaintyMetrics:
         """
         Calculate the "price" of missing data.
 
         Each missing feature adds to the uncertainty score.
         """
-        schema = context.get("schema", {}) or {}
-        ev = context.get("evidence", {}) or {}
+        schema_get = (context.get("schema") or {}).get
+        ev_get = (context.get("evidence") or {}).get
 
         # Missing outcome (high impact)
-        outcome_field = schema.get("outcome_field") or schema.get("outcomeField", "UNKNOWN")
+        outcome_field = schema_get("outcome_field") or schema_get("outcomeField", "UNKNOWN")
         missing_outcome = 0.4 if outcome_field == "NOT_FOUND" else 0.0
 
         # Small sample size (medium impact)
-        states_count = ev.get("states_count", 0)
+        states_count = ev_get("states_count", 0)
         small_sample = max(0, (20 - states_count) / 20 * 0.3) if states_count < 20 else 0.0
 
         # No comparison data (medium impact)
-        series_pool = ev.get("seriesPool", ev.get("series_pool", 0))
+        series_pool = ev_get("seriesPool", ev_get("series_pool", 0))
         no_comparison = 0.2 if series_pool == 0 else 0.0
 
         # Missing fact types
         missing_facts = []
-        total_facts = sum(len(f) for f in facts.values())
+        if total_facts is None:
+            total_facts = sum(map(len, facts.values()))
 
         if total_facts == 0:
             missing_facts.append("完全无可用数据")
@@ -176,7 +209,8 @@ class DecisionMapper:
     def _choose_decision_path(
         self,
         uncertainty: UncertaintyMetrics,
-        facts: Dict[str, List[Dict[str, Any]]]
+        facts: Dict[str, List[Dict[str, Any]]],
+        total_facts: Optional[int] = None
     ) -> DecisionPath:
         """
         Choose decision path based on uncertainty and available evidence.
@@ -186,22 +220,12 @@ class DecisionMapper:
         - total >= 0.4 → DEGRADED (uncertain but can provide value)
         - total < 0.4 → STANDARD (confident)
         """
-        total_facts = sum(len(f) for f in facts.values())
+        if total_facts is None:
+            total_facts = sum(map(len, facts.values()))
 
-        # No facts at all → reject
-        if total_facts == 0:
-            return DecisionPath.REJECT
-
-        # High uncertainty → reject
-        if uncertainty.total >= 0.8:
-            return DecisionPath.REJECT
-
-        # Medium uncertainty → degraded
-        if uncertainty.total >= 0.4:
-            return DecisionPath.DEGRADED
-
-        # Low uncertainty → standard
-        return DecisionPath.STANDARD
+        # No facts at all → reject; otherwise bucket the uncertainty
+        total = uncertainty.total
+        return _PATH_TABLE[total_facts == 0][(total >= 0.4) + (total >= 0.8)]
 
     def _generate_standard_decision(
         self,
@@ -214,10 +238,7 @@ class DecisionMapper:
 
         Delegates to intent-specific handlers.
         """
-        from driftcoach.analysis.synthesizer_router import AnswerSynthesizer
-
-        synthesizer = AnswerSynthesizer()
-        from driftcoach.analysis.answer_synthesizer import AnswerInput
+        synthesizer = default_synthesizer()
 
         # Create dummy AnswerInput
         inp = AnswerInput(
@@ -247,7 +268,8 @@ class DecisionMapper:
         intent: str,
         facts: Dict[str, List[Dict[str, Any]]],
         uncertainty: UncertaintyMetrics,
-        bounds: Any
+        bounds: Any,
+        available_facts: Optional[List[Dict[str, Any]]] = None
     ) -> CoachingDecision:
         """
         Generate degraded decision based on partial evidence.
@@ -255,13 +277,12 @@ class DecisionMapper:
         KEY: Never refuse to answer when ANY evidence exists.
         """
         # Extract available facts (any fact type)
-        available_facts = []
-        for fact_type, fact_list in facts.items():
-            available_facts.extend(fact_list)
+        if available_facts is None:
+            available_facts = list(chain.from_iterable(facts.values()))
 
         if not available_facts:
             # Should not happen here (would be reject path)
-            return self._generate_rejection(intent, facts, uncertainty)
+            return self._generate_rejection(intent, facts, uncertainty, 0)
 
         # Generate caveats based on uncertainty
         caveats = []
@@ -306,14 +327,16 @@ class DecisionMapper:
         self,
         intent: str,
         facts: Dict[str, List[Dict[str, Any]]],
-        uncertainty: UncertaintyMetrics
+        uncertainty: UncertaintyMetrics,
+        total_facts: Optional[int] = None
     ) -> CoachingDecision:
         """
         Generate explicit refusal when truly no evidence exists.
 
         This should be rare (only when total_facts == 0).
         """
-        total_facts = sum(len(f) for f in facts.values())
+        if total_facts is None:
+            total_facts = sum(map(len, facts.values()))
 
         return CoachingDecision(
             decision_path=DecisionPath.REJECT,
@@ -340,17 +363,14 @@ class DecisionMapper:
             return "无可用数据"
 
         # Count fact types
-        fact_types = {}
-        for fact in facts:
-            fact_type = fact.get("fact_type", "UNKNOWN")
-            fact_types[fact_type] = fact_types.get(fact_type, 0) + 1
+        fact_types = Counter(fact.get("fact_type", "UNKNOWN") for fact in facts)
 
         # Generate summary
         if len(fact_types) == 1:
-            type_name, count = list(fact_types.items())[0]
+            (type_name, count), = fact_types.items()
             return f"检测到 {count} 个 {type_name}"
         else:
-            top_types = sorted(fact_types.items(), key=lambda x: -x[1])[:2]
+            top_types = fact_types.most_common(2)
             type_desc = "、".join([f"{count}个{t}" for t, count in top_types])
             return f"检测到 {type_desc}"
 
@@ -387,19 +407,24 @@ class DecisionMapper:
         if uncertainty.no_comparison > 0:
             followups.append("添加对比数据（其他比赛/选手）")
 
-        # Suggest based on what's available
-        fact_types = set(f.get("fact_type", "UNKNOWN") for f in facts)
+        if len(followups) >= 3:
+            return followups
 
-        if "ROUND_SWING" in fact_types:
-            followups.append("深入分析反转回合的战术决策")
+        # Suggest based on what's available (scan stops once every type is seen)
+        seen = set()
+        for f in facts:
+            fact_type = f.get("fact_type", "UNKNOWN")
+            if fact_type in _FOLLOWUP_BY_TYPE:
+                seen.add(fact_type)
+                if len(seen) == len(_FOLLOWUP_BY_TYPE):
+                    break
+        followups.extend(msg for fact_type, msg in _FOLLOWUP_BY_TYPE.items() if fact_type in seen)
 
-        if "HIGH_RISK_SEQUENCE" in fact_types:
-            followups.append("回顾高风险回合的经济管理")
+        return followups[:3]
 
-        if "FORCE_BUY_ROUND" in fact_types:
-            followups.append("评估强起时机和收益")
 
-        return followups[:3]
+# DecisionMapper holds no instance state, so one shared instance serves every call
+_DEFAULT_MAPPER = DecisionMapper()
 
 
 def map_to_coaching_decision(
@@ -413,5 +438,4 @@ def map_to_coaching_decision(
 
     This is the main entry point for the decision mapping layer.
     """
-    mapper = DecisionMapper()
-    return mapper.map_to_decision(context, intent, facts, bounds)
+    return _DEFAULT_MAPPER.map_to_decision(context, intent, facts, bounds)
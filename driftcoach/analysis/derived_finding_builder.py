@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import math
+import sys
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 from driftcoach.question_state import DerivedFinding, FactRef, QuestionState
 
 
-FACT_TYPE_TO_FINDING = {
+_FACT_TYPE_TO_FINDING = {
     "ECONOMIC_PATTERN": "ECON_PROBLEM",
     "FORCE_BUY_ROUND": "ECON_PROBLEM",
     "ECO_COLLAPSE_SEQUENCE": "ECON_PROBLEM",
@@ -19,12 +23,19 @@ FACT_TYPE_TO_FINDING = {
     "PLAYER_IMPACT_STAT": "PLAYER_RISK",
     "HIGH_RISK_SEQUENCE": "PLAYER_RISK",
 }
+# Read-only, with interned keys/values so lookups by interned tags hit the identity fast path
+FACT_TYPE_TO_FINDING: Mapping[str, str] = MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _FACT_TYPE_TO_FINDING.items()}
+)
+
+_get_conf = attrgetter("confidence")
 
 
 def _confidence_from_fact_refs(facts: List[FactRef]) -> float:
-    if not facts:
+    n = len(facts)
+    if not n:
         return 0.35
-    return min(0.9, sum(f.confidence for f in facts) / len(facts))
+    return min(0.9, math.fsum(map(_get_conf, facts)) / n)
 
 
 def _finding_scope(intent: str) -> str:
@@ -66,9 +77,10 @@ def reuse_findings_from_pool(question_state: QuestionState, pool: List[DerivedFi
 
 
 def evaluate_question(findings: List[DerivedFinding]) -> Tuple[str, float]:
-    if not findings:
+    n = len(findings)
+    if not n:
         return "INSUFFICIENT", 0.2
-    conf = min(0.9, sum(f.confidence for f in findings) / len(findings))
+    conf = min(0.9, math.fsum(map(_get_conf, findings)) / n)
     if conf >= 0.65:
         return "ANSWERED", conf
     return "WEAK", conf
@@ -1,50 +1,63 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any, Dict, List
+import sys
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 from driftcoach.session.analysis_store import SessionAnalysisStore
 
-
-FACT_TO_NODE = {
+_FACT_TO_NODE = {
     "FORCE_BUY_ROUND": "ECONOMIC_DECISION",
     "ECONOMY_COLLAPSE": "RISK_PROFILE",
     "ROUND_SWING": "TURNING_POINT",
     "HIGH_RISK_SEQUENCE": "RISK_PROFILE",
     "OBJECTIVE_LOSS_CHAIN": "TACTICAL_MISTAKE",
 }
+# Read-only, with interned keys/values (see derived_finding_builder.FACT_TYPE_TO_FINDING)
+FACT_TO_NODE: Mapping[str, str] = MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _FACT_TO_NODE.items()}
+)
+
+_CONF_MAP = {"high": 0.7, "medium": 0.6}
+
+
+def _node_id_str(key: str) -> str:
+    # blake2b with a 5-byte digest: the same 10 hex chars on every deployment
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=5).hexdigest()
 
 
 def _node_id(payload: List[Any]) -> str:
-    raw = "|".join(str(x) for x in payload)
-    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:10]
+    return _node_id_str("|".join(str(x) for x in payload))
 
 
 def nodes_from_facts(facts: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
     now = SessionAnalysisStore._now()
     nodes: List[Dict[str, Any]] = []
+    fact_to_node = FACT_TO_NODE.get
+    conf_map_get = _CONF_MAP.get
     for fact in facts:
-        fact_type = fact.get("fact_type")
-        node_type = FACT_TO_NODE.get(fact_type)
+        fg = fact.get
+        fact_type = fg("fact_type")
+        node_type = fact_to_node(fact_type)
         if not node_type:
             continue
-        rr = fact.get("round_range") or [None, None]
+        rr = fg("round_range") or [None, None]
+        series_id = fg("series_id")
+        evs = fg("evidence_events")
         meta = {
             "fact_type": fact_type,
-            "series_id": fact.get("series_id"),
+            "series_id": series_id,
             "round_range": rr,
-            "derived_from": fact.get("derived_from"),
-            "evidence_events": fact.get("evidence_events", [])[:20],
-            "note": fact.get("note"),
+            "derived_from": fg("derived_from"),
+            "evidence_events": list(islice(evs, 20)) if evs else [],
+            "note": fg("note"),
         }
-        conf = 0.55
-        if fact.get("confidence") == "high":
-            conf = 0.7
-        elif fact.get("confidence") == "medium":
-            conf = 0.6
+        conf = conf_map_get(fg("confidence"), 0.55)
         nodes.append(
             {
-                "node_id": _node_id([node_type, fact.get("series_id"), tuple(rr)]),
+                "node_id": _node_id_str(f"{node_type}|{series_id}|{rr[0]}|{rr[1]}"),
                 "type": node_type,
                 "source": "file_download",
                 "axes_covered": ["round", "series"],
@@ -52,7 +65,7 @@ def nodes_from_facts(facts: List[Dict[str, Any]], query: str) -> List[Dict[str,
                 "created_from_query": query,
                 "created_at": now,
                 "last_updated_at": now,
-                "target": fact.get("series_id"),
+                "target": series_id,
                 "window": f"rounds_{rr[0]}_{rr[1]}",
                 "used_in_queries": [query],
                 "metadata": meta,
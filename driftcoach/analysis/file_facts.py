@@ -1,98 +1,234 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import struct
+import sys
 from collections import defaultdict, deque
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from driftcoach.adapters.grid.file_download_client import RawEvent
 
 
+@functools.lru_cache(maxsize=4096, typed=True)
+def _intern_id(value: Any) -> str:
+    return sys.intern(str(value))
+
+
+def _tid(value: Any) -> str:
+    """Canonical (interned) string form of a team id; ids repeat across every event."""
+    if type(value) is str:
+        return sys.intern(value)
+    try:
+        return _intern_id(value)
+    except TypeError:  # unhashable id payloads
+        return str(value)
+
+
+def _team_keys(role: str) -> Tuple[str, ...]:
+    return (role, f"{role}Id", f"{role}_id", f"{role}ID", f"{role}TeamId", f"{role}Team")
+
+
+# Candidate payload keys per team role, built once instead of per event
+_TEAM_KEYS: Dict[str, Tuple[str, ...]] = {
+    role: _team_keys(role) for role in ("team", "targetTeam", "winningTeam", "actorTeam", "victimTeam")
+}
+# Top-level fallback keys for the acting / targeted team, swept in one pass
+_ACTOR_TEAM_KEYS: Tuple[str, ...] = _TEAM_KEYS["team"] + _TEAM_KEYS["actorTeam"]
+_TARGET_TEAM_KEYS: Tuple[str, ...] = _TEAM_KEYS["targetTeam"] + _TEAM_KEYS["victimTeam"]
+
+
+def _payload_round(payload: Dict[str, Any]) -> Any:
+    """Raw round marker from an event payload, for events without ``RawEvent.round``."""
+    get = payload.get
+    r = get("roundNumber") or get("round") or get("round_num")
+    if r is None:
+        segs = None
+        ssd = get("seriesStateDelta")
+        if isinstance(ssd, dict):
+            segs = ssd.get("segments")
+            if not segs:
+                for g in ssd.get("games") or []:
+                    segs = g.get("segments")
+                    if segs:
+                        break
+        ss = get("seriesState")
+        if not segs and isinstance(ss, dict):
+            segs = ss.get("segments")
+            if not segs:
+                for g in ss.get("games") or []:
+                    segs = g.get("segments")
+                    if segs:
+                        break
+        if isinstance(segs, list) and segs:
+            seq = segs[0].get("sequenceNumber") or segs[0].get("sequence")
+            if seq is not None:
+                r = seq
+    return r
+
+
+def _as_round(r: Any) -> Optional[int]:
+    try:
+        return int(r)
+    except Exception:
+        return None
+
+
 def _round_key(ev: RawEvent) -> Optional[int]:
     r = ev.round
     if r is None:
-        payload = ev.payload or {}
-        r = payload.get("roundNumber") or payload.get("round") or payload.get("round_num")
-        if r is None:
-            segs = None
-            if isinstance(payload.get("seriesStateDelta"), dict):
-                ssd = payload["seriesStateDelta"]
-                segs = ssd.get("segments")
-                if not segs:
-                    for g in ssd.get("games") or []:
-                        segs = g.get("segments")
-                        if segs:
-                            break
-            if not segs and isinstance(payload.get("seriesState"), dict):
-                ss = payload["seriesState"]
-                segs = ss.get("segments")
-                if not segs:
-                    for g in ss.get("games") or []:
-                        segs = g.get("segments")
-                        if segs:
-                            break
-            if isinstance(segs, list) and segs:
-                seq = segs[0].get("sequenceNumber") or segs[0].get("sequence")
-                if seq is not None:
-                    r = seq
+        r = _payload_round(ev.payload or {})
+    return _as_round(r)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
     try:
-        return int(r)
+        return float(value)
     except Exception:
         return None
 
 
-def _collect_team_ids(payload: Dict[str, Any]) -> List[str]:
-    teams: List[str] = []
-    for path in ["seriesState", "seriesStateDelta"]:
-        ss = payload.get(path)
-        if isinstance(ss, dict):
-            for container in ["games", "segments"]:
-                for item in ss.get(container) or []:
-                    for t in item.get("teams") or []:
-                        tid = t.get("id")
-                        if tid:
-                            teams.append(str(tid))
-    return teams
+def _econ_record(team_obj: Any, round_hint: Any = None, game_hint: Any = None) -> Optional[Dict[str, Any]]:
+    if not isinstance(team_obj, dict):
+        return None
+    get = team_obj.get
+    tid = get("id") or get("teamId")
+    if not tid:
+        return None
+    return {
+        "teamId": _tid(tid),
+        "money": get("money"),
+        "loadoutValue": get("loadoutValue"),
+        "netWorth": get("netWorth"),
+        "players": get("players") or [],
+        "roundNumber": round_hint,
+        "gameIndex": game_hint,
+    }
+
+
+def _walk_series(payload: Dict[str, Any]) -> Tuple[Any, List[str], List[Dict[str, Any]], Any]:
+    """
+    Walk seriesState / seriesStateDelta once per event.
+
+    Returns (game_idx, team_ids, econ_records, loser_segments):
+    - game_idx / econ_records come from the primary state (seriesState, else the delta)
+    - team_ids cover games[] and segments[] teams of both states
+    - loser_segments are the delta's segments, else the full state's (for loser inference)
+    """
+    state = payload.get("seriesState")
+    delta = payload.get("seriesStateDelta")
+    primary = state or delta
+    game_idx = None
+    team_ids: List[str] = []
+    econ_teams: List[Dict[str, Any]] = []
+    econ_segs: List[Dict[str, Any]] = []
+    econ_games: List[Dict[str, Any]] = []
+    econ_done = False
+    loser_segs = None
+    for ss, is_delta in ((state, False), (delta, True)):
+        if not isinstance(ss, dict):
+            continue
+        record = ss is primary and not econ_done
+        econ_done = econ_done or record
+        games = ss.get("games") or []
+        segments = ss.get("segments") or []
+        if is_delta or not loser_segs:
+            loser_segs = segments or loser_segs
+
+        seg_ids: List[str] = []
+        for g in games:
+            g_teams = g.get("teams") or []
+            for t in g_teams:
+                tid = t.get("id")
+                if tid:
+                    team_ids.append(_tid(tid))
+            if record:
+                gseq = g.get("sequenceNumber")
+                if gseq is not None:
+                    game_idx = gseq
+                gseq = gseq or g.get("game")
+                for t in g_teams:
+                    rec = _econ_record(t, game_hint=gseq)
+                    if rec:
+                        econ_games.append(rec)
+                for seg in g.get("segments") or []:
+                    seq = seg.get("sequenceNumber") or seg.get("sequence")
+                    for t in seg.get("teams") or []:
+                        rec = _econ_record(t, round_hint=seq, game_hint=gseq)
+                        if rec:
+                            econ_games.append(rec)
+        for seg in segments:
+            s_teams = seg.get("teams") or []
+            for t in s_teams:
+                tid = t.get("id")
+                if tid:
+                    seg_ids.append(_tid(tid))
+            if record:
+                seq = seg.get("sequenceNumber") or seg.get("sequence")
+                for t in s_teams:
+                    rec = _econ_record(t, round_hint=seq)
+                    if rec:
+                        econ_segs.append(rec)
+        team_ids.extend(seg_ids)
+        if record:
+            for t in ss.get("teams") or []:
+                rec = _econ_record(t)
+                if rec:
+                    econ_teams.append(rec)
+    return game_idx, team_ids, econ_teams + econ_segs + econ_games, loser_segs
 
 
 def _team_from_payload(payload: Dict[str, Any], role: str = "team") -> Optional[str]:
-    keys = [role, f"{role}Id", f"{role}_id", f"{role}ID", f"{role}TeamId", f"{role}Team"]
+    return _team_from_keys(payload, _TEAM_KEYS.get(role) or _team_keys(role))
+
+
+def _team_from_keys(payload: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
+    get = payload.get
     for k in keys:
-        val = payload.get(k)
+        val = get(k)
         if val:
-            return str(val)
+            return _tid(val)
     return None
 
 
 def _actor_team(payload: Dict[str, Any]) -> Optional[str]:
     actor = payload.get("actor")
     if isinstance(actor, dict):
-        if actor.get("type") == "team" and actor.get("id"):
-            return str(actor.get("id"))
-        state = actor.get("state") or actor.get("stateDelta")
+        get = actor.get
+        tid = get("id")
+        if tid and get("type") == "team":
+            return _tid(tid)
+        state = get("state") or get("stateDelta")
         if isinstance(state, dict):
             tid = state.get("teamId") or state.get("team")
             if tid:
-                return str(tid)
-    return _team_from_payload(payload, role="team")
+                return _tid(tid)
+    return _team_from_keys(payload, _ACTOR_TEAM_KEYS)
 
 
 def _target_team(payload: Dict[str, Any]) -> Optional[str]:
     target = payload.get("target")
     if isinstance(target, dict):
-        if target.get("type") == "team" and target.get("id"):
-            return str(target.get("id"))
-        state = target.get("state") or target.get("stateDelta")
+        get = target.get
+        tid = get("id")
+        if tid and get("type") == "team":
+            return _tid(tid)
+        state = get("state") or get("stateDelta")
         if isinstance(state, dict):
             tid = state.get("teamId") or state.get("team")
             if tid:
-                return str(tid)
-    return _team_from_payload(payload, role="targetTeam")
+                return _tid(tid)
+    return _team_from_keys(payload, _TARGET_TEAM_KEYS)
 
 
 def _winner_from_payload(payload: Dict[str, Any]) -> Optional[str]:
     direct = _team_from_payload(payload, role="winningTeam") or payload.get("winner") or payload.get("winnerTeam")
     if direct:
-        return str(direct)
+        return _tid(direct)
     actor = payload.get("actor")
     if isinstance(actor, dict):
         for state_key in ["state", "stateDelta"]:
@@ -102,19 +238,19 @@ def _winner_from_payload(payload: Dict[str, Any]) -> Optional[str]:
             for container in ["teams"]:
                 for t in st.get(container) or []:
                     if t.get("won") and t.get("id"):
-                        return str(t.get("id"))
+                        return _tid(t.get("id"))
             for g in st.get("games") or []:
                 for t in g.get("teams") or []:
                     if t.get("won") and t.get("id"):
-                        return str(t.get("id"))
+                        return _tid(t.get("id"))
                 for seg in g.get("segments") or []:
                     for t in seg.get("teams") or []:
                         if t.get("won") and t.get("id"):
-                            return str(t.get("id"))
+                            return _tid(t.get("id"))
             for seg in st.get("segments") or []:
                 for t in seg.get("teams") or []:
                     if t.get("won") and t.get("id"):
-                        return str(t.get("id"))
+                        return _tid(t.get("id"))
     # series state segments may hold winners
     for path in ["seriesState", "seriesStateDelta"]:
         ss = payload.get(path)
@@ -124,110 +260,275 @@ def _winner_from_payload(payload: Dict[str, Any]) -> Optional[str]:
                     if t.get("won"):
                         tid = t.get("id")
                         if tid:
-                            return str(tid)
+                            return _tid(tid)
     return None
 
 
-def _md5(payload: Any) -> str:
-    return hashlib.md5(str(payload).encode("utf-8")).hexdigest()[:10]
+_NO_COUNTS: Dict[str, int] = {}
+_EMPTY_PAYLOAD: Dict[str, Any] = {}
+_MISS = object()
+
+
+def _extend_span(spans: Dict[str, List[int]], team_id: str, rk: int) -> None:
+    span = spans.get(team_id)
+    if span is None:
+        spans[team_id] = [rk, rk, 1]
+    else:
+        span[1] = rk
+        span[2] += 1
+
+
+def _new_econ_rec() -> Dict[str, Any]:
+    return {"game_index": None, "winner": None, "loser": None, "entries": []}
+
+
+def _econ_snapshot(rec: Dict[str, Any]) -> Dict[str, Any]:
+    """Aggregate a (round, team) record's economy entries once, when its row is built."""
+    team_money = None
+    team_loadout = None
+    team_networth = None
+    entry_players: List[Any] = []
+    for e in rec["entries"]:
+        get = e.get
+        money = get("money")
+        if money is not None:
+            try:
+                money = float(money)
+                team_money = money if team_money is None else max(team_money, money)
+            except Exception:
+                pass
+        loadout = get("loadoutValue")
+        if loadout is not None:
+            try:
+                loadout = float(loadout)
+                team_loadout = loadout if team_loadout is None else max(team_loadout, loadout)
+            except Exception:
+                pass
+        networth = get("netWorth")
+        if networth is not None:
+            try:
+                networth = float(networth)
+                team_networth = networth if team_networth is None else max(team_networth, networth)
+            except Exception:
+                pass
+        ps = get("players")
+        if isinstance(ps, list):
+            entry_players.extend(ps)
+    players: List[Tuple[str, float]] = []  # (player id, loadout) pairs for the force-buy check
+    player_loadouts: List[float] = []
+    player_money: List[float] = []
+    for p in entry_players:
+        if not isinstance(p, dict):
+            continue
+        lv_f = _to_float(p.get("loadoutValue"))
+        if lv_f is not None:
+            player_loadouts.append(lv_f)
+            pid = p.get("id") or p.get("playerId")
+            if pid is not None:
+                players.append((str(pid), lv_f))
+        # per-player money is only the fallback when no entry carried a team total
+        if team_money is None:
+            mo_f = _to_float(p.get("money"))
+            if mo_f is not None:
+                player_money.append(mo_f)
+    avg_player_loadout = sum(player_loadouts) / len(player_loadouts) if player_loadouts else None
+    avg_player_money = sum(player_money) / len(player_money) if player_money else None
+    return {
+        "team_avg_loadout": team_loadout if team_loadout is not None else avg_player_loadout,
+        "team_avg_money": team_money if team_money is not None else avg_player_money,
+        "team_networth": team_networth,
+        "players": players,
+    }
+
+
+# A team's buy baseline is the max of its last few known loadouts
+_ECON_BASELINE_WINDOW = 6
+# Below this many rounds per team the scalar sweep beats building arrays
+_ECON_VECTORIZE_MIN_ROUNDS = 64
+
+
+def _loadout_ratios(
+    loadouts: List[Optional[float]],
+) -> Tuple[List[Optional[float]], List[Optional[float]], List[bool]]:
+    """Per-round (baseline, loadout ratio, full-buy flag) for one team's loadouts in round order."""
+    n = len(loadouts)
+    if n < _ECON_VECTORIZE_MIN_ROUNDS:
+        recent: deque = deque(maxlen=_ECON_BASELINE_WINDOW)
+        baselines: List[Optional[float]] = []
+        ratios: List[Optional[float]] = []
+        full_buy: List[bool] = []
+        for loadout in loadouts:
+            baseline = max(recent) if recent else loadout
+            known = bool(baseline) and loadout is not None
+            baselines.append(baseline)
+            ratios.append(loadout / baseline if known else None)
+            full_buy.append(known and loadout >= 0.9 * baseline)
+            if loadout is not None:
+                recent.append(loadout)
+        return baselines, ratios, full_buy
+
+    known = np.fromiter((v is not None for v in loadouts), dtype=bool, count=n)
+    vals = np.fromiter((v for v in loadouts if v is not None), dtype=float)
+    # prior[c] = max of the window of known loadouts before the (c+1)-th one
+    window = _ECON_BASELINE_WINDOW
+    padded = np.concatenate((np.full(window, -np.inf), vals))
+    prior = padded[: vals.size + 1].copy()
+    for k in range(1, window):
+        np.maximum(prior, padded[k : k + vals.size + 1], out=prior)
+    seen = np.cumsum(known) - known
+    has_history = seen > 0
+    loadout_arr = np.zeros(n)
+    loadout_arr[known] = vals
+    baseline_arr = np.where(has_history, prior[seen], loadout_arr)
+    has_baseline = has_history | known
+    valid = known & has_baseline & (baseline_arr != 0)
+    ratio_arr = np.divide(loadout_arr, baseline_arr, out=np.zeros(n), where=valid)
+    full_arr = valid & (loadout_arr >= 0.9 * baseline_arr)
+    baseline_list = baseline_arr.tolist()
+    ratio_list = ratio_arr.tolist()
+    return (
+        [b if h else None for b, h in zip(baseline_list, has_baseline.tolist())],
+        [r if v else None for r, v in zip(ratio_list, valid.tolist())],
+        full_arr.tolist(),
+    )
+
+
+def _econ_rec(econ_by_round_team: Dict[int, Dict[str, Dict[str, Any]]], rr: int, tid: str) -> Dict[str, Any]:
+    by_team = econ_by_round_team.get(rr)
+    if by_team is None:
+        by_team = econ_by_round_team[rr] = {}
+    rec = by_team.get(tid)
+    if rec is None:
+        rec = by_team[tid] = _new_econ_rec()
+    return rec
+
+
+@functools.lru_cache(maxsize=4096)
+def _round_range_tag(start: Any, end: Any) -> str:
+    """Short stable tag for a round range, used in fact ids (not security sensitive)."""
+    try:
+        raw = struct.pack("<qq", start, end)
+    except (struct.error, TypeError):
+        raw = str((start, end)).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=5).hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def _fact_id(fact_type: str, start: Any, end: Any) -> str:
+    return f"fact_{fact_type.lower()}_{_round_range_tag(start, end)}"
 
 
 def compress_events_to_facts(series_id: str, events: List[RawEvent]) -> List[Dict[str, Any]]:
     if not series_id or not events:
         return []
 
-    rounds: Dict[int, Dict[str, Any]] = defaultdict(
-        lambda: {"events": [], "kills": defaultdict(int), "deaths": defaultdict(int), "teams": set(), "game_index": None}
-    )
+    # Per-round state as parallel dicts keyed by round; events_by_round also
+    # fixes round order (first seen) for the passes below. Events without a
+    # round key share the -1 round, so genuine round -1 events are kept apart.
+    events_by_round: Dict[int, List[RawEvent]] = {}
+    keyed_minus_one: List[RawEvent] = []
+    teams_by_round: Dict[int, set] = {}
+    kills_by_round: Dict[int, Dict[str, int]] = {}
+    deaths_by_round: Dict[int, Dict[str, int]] = {}
+    game_index_by_round: Dict[int, Any] = {}
+    first_kill_by_round: Dict[int, str] = {}
+    winners: Dict[int, Optional[str]] = {}
+    losers: Dict[int, Any] = {}
+    # (economy round, team id, entry) triples, resolved as the entries are ingested
+    econ_by_round: Dict[int, List[Tuple[int, str, Dict[str, Any]]]] = {}
+
+    # Streams repeat the same payload object across duplicate deltas, so the
+    # payload-derived round and winner are memoized by id() for this call only
+    # (the events list keeps every payload alive until we return).
+    payload_rounds: Dict[int, Optional[int]] = {}
+    payload_winners: Dict[int, Optional[str]] = {}
+
+    # Round keys are parsed once per event; later passes reuse the per-round lists
+    round_keys: List[Optional[int]] = []
     for ev in events:
-        rk = _round_key(ev)
-        payload = ev.payload or {}
-        team = _actor_team(payload) or _team_from_payload(payload, role="actorTeam")
-        target_team = _target_team(payload) or _team_from_payload(payload, role="victimTeam")
-        game_idx = None
-        ss = payload.get("seriesState") or payload.get("seriesStateDelta")
-
-        def _record_econ(team_obj: Dict[str, Any], round_hint: Optional[int] = None, game_hint: Optional[int] = None) -> None:
-            if not isinstance(team_obj, dict):
-                return
-            tid = team_obj.get("id") or team_obj.get("teamId")
-            if not tid:
-                return
-            bucket.setdefault("economy", []).append(
-                {
-                    "teamId": str(tid),
-                    "money": team_obj.get("money"),
-                    "loadoutValue": team_obj.get("loadoutValue"),
-                    "netWorth": team_obj.get("netWorth"),
-                    "players": team_obj.get("players") or [],
-                    "roundNumber": round_hint,
-                    "gameIndex": game_hint,
-                }
-            )
-
-        if isinstance(ss, dict):
-            for g in ss.get("games") or []:
-                if g.get("sequenceNumber") is not None:
-                    game_idx = g.get("sequenceNumber")
-
-        bucket = rounds[rk if rk is not None else -1]
-        bucket["events"].append(ev)
+        r = ev.round
+        if r is None:
+            payload = ev.payload or _EMPTY_PAYLOAD
+            pkey = id(payload)
+            rk = payload_rounds.get(pkey, _MISS)
+            if rk is _MISS:
+                rk = payload_rounds[pkey] = _as_round(_payload_round(payload))
+            round_keys.append(rk)
+        else:
+            round_keys.append(_as_round(r))
+    for ev, rk in zip(events, round_keys):
+        payload = ev.payload or _EMPTY_PAYLOAD
+        game_idx, team_ids, econ_records, loser_segs = _walk_series(payload)
+
+        key = rk if rk is not None else -1
+        round_events = events_by_round.get(key)
+        if round_events is None:
+            round_events = events_by_round[key] = []
+            teams_by_round[key] = set()
+        round_events.append(ev)
+        if rk == -1:
+            keyed_minus_one.append(ev)
         if game_idx is not None:
-            bucket["game_index"] = game_idx
-        for tid in _collect_team_ids(payload):
-            bucket["teams"].add(tid)
-        if ev.kind == "KILL_DEATH":
+            game_index_by_round[key] = game_idx
+        teams_by_round[key].update(team_ids)
+        # Actor/victim teams are only read by kills and round ends, so they are
+        # resolved inside those branches rather than for every event.
+        kind = ev.kind
+        if kind == "KILL_DEATH":
+            team = _actor_team(payload)
+            target_team = _target_team(payload)
             if team:
-                bucket["kills"][team] += 1
+                kills = kills_by_round.get(key)
+                if kills is None:
+                    kills = kills_by_round[key] = {}
+                kills[team] = kills.get(team, 0) + 1
             if target_team:
-                bucket["deaths"][target_team] += 1
-            if team and target_team and team != target_team and not bucket.get("first_kill_team"):
-                bucket["first_kill_team"] = team
-                bucket["first_kill_victim_team"] = target_team
-        if ev.kind == "ROUND_END":
-            bucket["winner"] = _winner_from_payload(payload) or team
-            bucket["loser"] = payload.get("loser") or payload.get("losingTeam") or payload.get("defeatedTeam")
-        if ev.kind == "OBJECTIVE":
-            bucket.setdefault("objectives", []).append(payload)
-        if ev.kind == "ECONOMY_SNAPSHOT":
-            bucket.setdefault("economy", []).append(payload)
+                deaths = deaths_by_round.get(key)
+                if deaths is None:
+                    deaths = deaths_by_round[key] = {}
+                deaths[target_team] = deaths.get(target_team, 0) + 1
+            if team and target_team and team != target_team and key not in first_kill_by_round:
+                first_kill_by_round[key] = team
+        elif kind == "ROUND_END":
+            winner = payload_winners.get(id(payload), _MISS)
+            if winner is _MISS:
+                winner = payload_winners[id(payload)] = _winner_from_payload(payload)
+            winners[key] = winner or _actor_team(payload)
+            losers[key] = payload.get("loser") or payload.get("losingTeam") or payload.get("defeatedTeam")
+        elif kind == "ECONOMY_SNAPSHOT":
+            rr = payload.get("roundNumber")
+            rr = int(rr) if rr is not None else key
+            tid = payload.get("teamId") or payload.get("team")
+            if tid:
+                econ_by_round.setdefault(key, []).append((rr, _tid(tid), payload))
 
-        if isinstance(ss, dict):
-            for t in ss.get("teams") or []:
-                _record_econ(t)
-            for seg in ss.get("segments") or []:
-                seq = seg.get("sequenceNumber") or seg.get("sequence")
-                for t in seg.get("teams") or []:
-                    _record_econ(t, round_hint=seq)
-            for g in ss.get("games") or []:
-                gseq = g.get("sequenceNumber") or g.get("game")
-                for t in g.get("teams") or []:
-                    _record_econ(t, game_hint=gseq)
-                for seg in g.get("segments") or []:
-                    seq = seg.get("sequenceNumber") or seg.get("sequence")
-                    for t in seg.get("teams") or []:
-                        _record_econ(t, round_hint=seq, game_hint=gseq)
+        if econ_records:
+            entries = econ_by_round.setdefault(key, [])
+            for econ in econ_records:
+                # _econ_record already interned teamId and dropped team-less entries
+                rr = econ["roundNumber"]
+                entries.append((int(rr) if rr is not None else key, econ["teamId"], econ))
 
         # Infer loser from segments when winner known
-        if ev.kind == "ROUND_END" and bucket.get("winner") and not bucket.get("loser"):
-            segs = None
-            if isinstance(payload.get("seriesStateDelta"), dict):
-                segs = payload["seriesStateDelta"].get("segments")
-            if not segs and isinstance(payload.get("seriesState"), dict):
-                segs = payload["seriesState"].get("segments")
+        if kind == "ROUND_END" and winners[key] and not losers[key]:
+            segs = loser_segs
             if isinstance(segs, list) and segs:
                 teams_in_seg = segs[0].get("teams") or []
-                candidates = [str(t.get("id")) for t in teams_in_seg if t.get("id")]
-                others = [c for c in candidates if c != bucket.get("winner")]
-                if others:
-                    bucket["loser"] = others[0]
+                winner = winners[key]
+                other = next(
+                    (c for c in (_tid(t.get("id")) for t in teams_in_seg if t.get("id")) if c != winner),
+                    None,
+                )
+                if other is not None:
+                    losers[key] = other
 
     # second pass loser inference using team set
-    for bucket in rounds.values():
-        if bucket.get("winner") and not bucket.get("loser") and len(bucket.get("teams") or []) >= 2:
-            others = [t for t in bucket["teams"] if t != bucket.get("winner")]
-            if others:
-                bucket["loser"] = others[0]
+    for rk, winner in winners.items():
+        teams = teams_by_round[rk]
+        if winner and not losers.get(rk) and len(teams) >= 2:
+            other = next((t for t in teams if t != winner), None)
+            if other is not None:
+                losers[rk] = other
 
     facts: List[Dict[str, Any]] = []
 
@@ -241,225 +542,191 @@ def compress_events_to_facts(series_id: str, events: List[RawEvent]) -> List[Dic
         note: Optional[str] = None,
         extra: Optional[Dict[str, Any]] = None,
     ) -> None:
-        facts.append(
-            {
-                "fact_type": fact_type,
-                "series_id": series_id,
-                "game_index": game_index,
-                "round_range": [round_range[0], round_range[1]],
-                "evidence_events": [e.payload for e in evs],
-                "confidence": confidence,
-                "derived_from": "file_download",
-                "fact_id": f"fact_{fact_type.lower()}_{_md5(round_range)}",
-                "note": note,
-                **(extra or {}),
-            }
-        )
+        fact = {
+            "fact_type": fact_type,
+            "series_id": series_id,
+            "game_index": game_index,
+            "round_range": [round_range[0], round_range[1]],
+            "evidence_events": [e.payload for e in evs],
+            "confidence": confidence,
+            "derived_from": "file_download",
+            "fact_id": _fact_id(fact_type, round_range[0], round_range[1]),
+        }
+        # Readers use fact.get("note"), so facts without a note omit the key.
+        if note is not None:
+            fact["note"] = note
+        if extra:
+            fact.update(extra)
+        facts.append(fact)
     # Economy-driven facts (FORCE_BUY_ROUND, FULL_BUY_ROUND, ECO_COLLAPSE_SEQUENCE)
-    econ_by_round_team: Dict[int, Dict[str, Dict[str, Any]]] = defaultdict(lambda: defaultdict(lambda: {"entries": [], "game_index": None, "winner": None, "loser": None}))
-    for rk, bucket in rounds.items():
-        econ_entries = bucket.get("economy") or []
-        for econ in econ_entries:
-            rr = econ.get("roundNumber")
-            rr = int(rr) if rr is not None else rk
-            if rr is None:
-                continue
-            tid = econ.get("teamId") or econ.get("team")
-            if not tid:
-                continue
-            rec = econ_by_round_team[rr][str(tid)]
+    econ_by_round_team: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    for rk in events_by_round:
+        game_index = game_index_by_round.get(rk)
+        winner = winners.get(rk)
+        loser = losers.get(rk)
+        for rr, tid, econ in econ_by_round.get(rk) or ():
+            rec = _econ_rec(econ_by_round_team, rr, tid)
             rec["entries"].append(econ)
-            if bucket.get("game_index") is not None:
-                rec["game_index"] = bucket.get("game_index")
+            if game_index is not None:
+                rec["game_index"] = game_index
             elif econ.get("gameIndex") is not None:
                 rec["game_index"] = econ.get("gameIndex")
-            rec["winner"] = rec.get("winner") or bucket.get("winner")
-            rec["loser"] = rec.get("loser") or bucket.get("loser")
+            rec["winner"] = rec.get("winner") or winner
+            rec["loser"] = rec.get("loser") or loser
         # propagate winner/loser even if no econ entries
-        if bucket.get("winner") and bucket.get("loser"):
-            for tid in list(bucket.get("teams") or []):
-                rec = econ_by_round_team[rk][str(tid)]
-                rec["winner"] = bucket.get("winner")
-                rec["loser"] = bucket.get("loser")
-                rec["game_index"] = rec.get("game_index") or bucket.get("game_index")
-
-    def _aggregate_snapshot(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-        team_money = None
-        team_loadout = None
-        team_networth = None
-        players: List[Dict[str, Any]] = []
-        for e in entries:
-            if e.get("money") is not None:
-                try:
-                    team_money = float(e.get("money")) if team_money is None else max(team_money, float(e.get("money")))
-                except Exception:
-                    pass
-            if e.get("loadoutValue") is not None:
-                try:
-                    team_loadout = float(e.get("loadoutValue")) if team_loadout is None else max(team_loadout, float(e.get("loadoutValue")))
-                except Exception:
-                    pass
-            if e.get("netWorth") is not None:
-                try:
-                    team_networth = float(e.get("netWorth")) if team_networth is None else max(team_networth, float(e.get("netWorth")))
-                except Exception:
-                    pass
-            if isinstance(e.get("players"), list):
-                players.extend(e.get("players"))
-        player_loadouts = []
-        player_money = []
-        normalized_players = []
-        for p in players:
-            if not isinstance(p, dict):
-                continue
-            pid = p.get("id") or p.get("playerId")
-            lv = p.get("loadoutValue")
-            mo = p.get("money")
-            if lv is not None:
-                try:
-                    player_loadouts.append(float(lv))
-                except Exception:
-                    pass
-            if mo is not None:
-                try:
-                    player_money.append(float(mo))
-                except Exception:
-                    pass
-            normalized_players.append({"id": pid, "loadoutValue": lv, "money": mo})
-        avg_player_loadout = sum(player_loadouts) / len(player_loadouts) if player_loadouts else None
-        avg_player_money = sum(player_money) / len(player_money) if player_money else None
-        team_avg_loadout = team_loadout if team_loadout is not None else avg_player_loadout
-        team_avg_money = team_money if team_money is not None else avg_player_money
-        return {
-            "team_avg_loadout": team_avg_loadout,
-            "team_avg_money": team_avg_money,
-            "team_networth": team_networth,
-            "players": normalized_players,
-        }
-
-    team_recent_loadouts: Dict[str, deque] = defaultdict(lambda: deque(maxlen=6))
-    player_recent_max: Dict[str, float] = defaultdict(float)
-    collapse_chain: Dict[str, List[int]] = defaultdict(list)
-
-    for rr in sorted([rk for rk in econ_by_round_team.keys() if rk is not None]):
+        if winner and loser:
+            for tid in teams_by_round[rk]:
+                rec = _econ_rec(econ_by_round_team, rk, tid)
+                rec["winner"] = winner
+                rec["loser"] = loser
+                rec["game_index"] = rec.get("game_index") or game_index
+
+    # Baselines, ratios and full-buy flags are computed per team over the whole
+    # series up front; the sweep below only walks rounds to emit facts.
+    econ_rows: List[Tuple[int, str, Dict[str, Any], Dict[str, Any]]] = []
+    team_rows: Dict[str, List[int]] = defaultdict(list)
+    row_team_pos: List[int] = []  # position of each row within its team's rows
+    # Economy round keys are always ints (the -1 bucket stands in for unknown
+    # rounds), so there is nothing to filter before sorting.
+    for rr in sorted(econ_by_round_team):
         for team_id, rec in econ_by_round_team[rr].items():
-            snapshot = _aggregate_snapshot(rec["entries"])
-            team_loadout = snapshot.get("team_avg_loadout")
-            team_money = snapshot.get("team_avg_money")
-            players = snapshot.get("players") or []
-            recent_vals = list(team_recent_loadouts[team_id])
-            baseline = max(recent_vals) if recent_vals else team_loadout
-            if baseline and team_loadout is not None:
-                loadout_ratio = team_loadout / baseline if baseline else 0
-            else:
-                loadout_ratio = None
-
-            # FULL_BUY_ROUND
-            if baseline and team_loadout is not None and team_loadout >= 0.9 * baseline:
+            rows = team_rows[team_id]
+            row_team_pos.append(len(rows))
+            rows.append(len(econ_rows))
+            econ_rows.append((rr, team_id, rec, _econ_snapshot(rec)))
+    row_baseline: List[Optional[float]] = [None] * len(econ_rows)
+    row_ratio: List[Optional[float]] = [None] * len(econ_rows)
+    row_full_buy: List[bool] = [False] * len(econ_rows)
+    for rows in team_rows.values():
+        baselines, ratios, full_buy = _loadout_ratios([econ_rows[i][3].get("team_avg_loadout") for i in rows])
+        for i, baseline, ratio, full in zip(rows, baselines, ratios, full_buy):
+            row_baseline[i] = baseline
+            row_ratio[i] = ratio
+            row_full_buy[i] = full
+
+    # Per-player running max loadout, backed by a flat list indexed by a dense
+    # player slot assigned on first sight (rosters are ~10 players per series).
+    player_slot: Dict[str, int] = {}
+    player_recent_max: List[float] = []
+    # Low-econ runs are consecutive rows of one team, so a run is just
+    # (start position in team_rows, length); round lists are built on emission.
+    collapse_chain: Dict[str, Tuple[int, int]] = {}
+
+    def collapse_rounds(team_id: str, run: Tuple[int, int]) -> List[int]:
+        start, length = run
+        return [econ_rows[i][0] for i in team_rows[team_id][start : start + length]]
+
+    for row, (rr, team_id, rec, snapshot) in enumerate(econ_rows):
+        team_loadout = snapshot.get("team_avg_loadout")
+        team_money = snapshot.get("team_avg_money")
+        players = snapshot.get("players") or []
+        baseline = row_baseline[row]
+        loadout_ratio = row_ratio[row]
+
+        # FULL_BUY_ROUND
+        if row_full_buy[row]:
+            add_fact(
+                "FULL_BUY_ROUND",
+                rec.get("game_index"),
+                (rr, rr),
+                [],
+                "medium",
+                extra={"team_id": team_id, "round": rr, "loadout_ratio": loadout_ratio},
+            )
+
+        # FORCE_BUY_ROUND
+        players_full_buy = 0
+        for pid, lv_f in players:
+            slot = player_slot.get(pid)
+            if slot is None:
+                slot = player_slot[pid] = len(player_recent_max)
+                player_recent_max.append(0.0)
+            prev_max = player_recent_max[slot]
+            baseline_player = prev_max or lv_f
+            if baseline_player and lv_f >= 0.7 * baseline_player:
+                players_full_buy += 1
+            if lv_f > prev_max:
+                player_recent_max[slot] = lv_f
+
+        eco_threshold_mid = 0.55 * baseline if baseline else None
+        if baseline and team_loadout is not None and eco_threshold_mid is not None:
+            if team_loadout < eco_threshold_mid and players_full_buy >= 2:
+                result = "UNKNOWN"
+                if rec.get("winner"):
+                    result = "SUCCESS" if rec.get("winner") == team_id else "FAIL"
                 add_fact(
-                    "FULL_BUY_ROUND",
+                    "FORCE_BUY_ROUND",
                     rec.get("game_index"),
                     (rr, rr),
                     [],
                     "medium",
-                    extra={"team_id": team_id, "round": rr, "loadout_ratio": loadout_ratio},
+                    extra={
+                        "team_id": team_id,
+                        "round": rr,
+                        "result": result,
+                        "economy_context": {
+                            "team_loadout_ratio": loadout_ratio,
+                            "players_full_buy_count": players_full_buy,
+                            "team_money": team_money,
+                        },
+                    },
                 )
 
-            # FORCE_BUY_ROUND
-            players_full_buy = 0
-            for p in players:
-                pid = p.get("id")
-                lv = p.get("loadoutValue")
-                if pid is None or lv is None:
-                    continue
-                try:
-                    lv_f = float(lv)
-                except Exception:
-                    continue
-                baseline_player = player_recent_max.get(str(pid)) or lv_f
-                if baseline_player and lv_f >= 0.7 * baseline_player:
-                    players_full_buy += 1
-                if lv_f > player_recent_max.get(str(pid), 0):
-                    player_recent_max[str(pid)] = lv_f
-
-            eco_threshold_mid = 0.55 * baseline if baseline else None
-            if baseline and team_loadout is not None and eco_threshold_mid is not None:
-                if team_loadout < eco_threshold_mid and players_full_buy >= 2:
-                    result = "UNKNOWN"
-                    if rec.get("winner"):
-                        result = "SUCCESS" if rec.get("winner") == team_id else "FAIL"
-                    add_fact(
-                        "FORCE_BUY_ROUND",
-                        rec.get("game_index"),
-                        (rr, rr),
-                        [],
-                        "medium",
-                        extra={
-                            "team_id": team_id,
-                            "round": rr,
-                            "result": result,
-                            "economy_context": {
-                                "team_loadout_ratio": loadout_ratio,
-                                "players_full_buy_count": players_full_buy,
-                                "team_money": team_money,
-                            },
-                        },
-                    )
-
-            # ECO_COLLAPSE_SEQUENCE tracking (low-econ run until recovery)
-            if loadout_ratio is not None and loadout_ratio < 0.55:
-                collapse_chain[team_id].append(rr)
-            else:
-                if len(collapse_chain[team_id]) >= 2:
-                    rounds_span = collapse_chain[team_id]
-                    add_fact(
-                        "ECO_COLLAPSE_SEQUENCE",
-                        rec.get("game_index"),
-                        (rounds_span[0], rounds_span[-1]),
-                        [],
-                        "medium",
-                        extra={"team_id": team_id, "rounds": rounds_span, "severity": "HIGH" if len(rounds_span) >= 3 else "MEDIUM"},
-                    )
-                collapse_chain[team_id] = []
-
-            if team_loadout is not None:
-                team_recent_loadouts[team_id].append(team_loadout)
-
-    # flush remaining collapse chains
-    for team_id, seq in collapse_chain.items():
-        if len(seq) >= 2:
+        # ECO_COLLAPSE_SEQUENCE tracking (low-econ run until recovery)
+        if loadout_ratio is not None and loadout_ratio < 0.55:
+            run = collapse_chain.get(team_id)
+            collapse_chain[team_id] = (run[0], run[1] + 1) if run else (row_team_pos[row], 1)
+        else:
+            run = collapse_chain.pop(team_id, None)
+            if run and run[1] >= 2:
+                rounds_span = collapse_rounds(team_id, run)
+                add_fact(
+                    "ECO_COLLAPSE_SEQUENCE",
+                    rec.get("game_index"),
+                    (rounds_span[0], rounds_span[-1]),
+                    [],
+                    "medium",
+                    extra={"team_id": team_id, "rounds": rounds_span, "severity": "HIGH" if run[1] >= 3 else "MEDIUM"},
+                )
+
+    # flush remaining collapse chains (in team first-appearance order)
+    for team_id in team_rows:
+        run = collapse_chain.get(team_id)
+        if run and run[1] >= 2:
+            seq = collapse_rounds(team_id, run)
             add_fact(
                 "ECO_COLLAPSE_SEQUENCE",
                 None,
                 (seq[0], seq[-1]),
                 [],
                 "medium",
-                extra={"team_id": team_id, "rounds": seq, "severity": "HIGH" if len(seq) >= 3 else "MEDIUM"},
+                extra={"team_id": team_id, "rounds": seq, "severity": "HIGH" if run[1] >= 3 else "MEDIUM"},
             )
 
     # ROUND_SWING & HIGH_RISK_SEQUENCE & OBJECTIVE_LOSS_CHAIN
-    sorted_rounds = sorted([rk for rk in rounds.keys() if rk is not None])
-    loss_chain: Dict[str, List[int]] = defaultdict(list)
-    death_surplus_chain: Dict[str, List[int]] = defaultdict(list)
+    sorted_rounds = sorted(events_by_round)
+    # Both chains count every qualifying round per team (not only consecutive
+    # ones), so the sweep keeps [first, last, count] spans instead of round lists.
+    loss_chain: Dict[str, List[int]] = {}
+    death_surplus_chain: Dict[str, List[int]] = {}
     for rk in sorted_rounds:
-        bucket = rounds[rk]
-        winner = bucket.get("winner")
-        loser = bucket.get("loser")
-        kills = bucket.get("kills", {})
-        deaths = bucket.get("deaths", {})
+        winner = winners.get(rk)
+        loser = losers.get(rk)
+        kills = kills_by_round.get(rk, _NO_COUNTS)
+        deaths = deaths_by_round.get(rk, _NO_COUNTS)
         if winner and loser:
-            loss_chain[loser].append(rk)
+            _extend_span(loss_chain, loser, rk)
         for team_id, death_ct in deaths.items():
             kill_ct = kills.get(team_id, 0)
             if death_ct - kill_ct >= 2:
-                death_surplus_chain[team_id].append(rk)
+                _extend_span(death_surplus_chain, team_id, rk)
         # Round swing: opening advantage flips outcome
-        opening_team = bucket.get("first_kill_team")
+        opening_team = first_kill_by_round.get(rk)
         if winner and opening_team and winner != opening_team:
-            evs = [e for e in bucket.get("events", []) if _round_key(e) == rk]
+            evs = events_by_round[rk] if rk != -1 else keyed_minus_one
             add_fact(
                 "ROUND_SWING",
-                bucket.get("game_index"),
+                game_index_by_round.get(rk),
                 (rk, rk),
                 evs,
                 "high",
@@ -470,10 +737,10 @@ def compress_events_to_facts(series_id: str, events: List[RawEvent]) -> List[Dic
             win_k = kills.get(winner, 0)
             lose_k = kills.get(loser, 0)
             if lose_k > win_k:
-                evs = [e for e in bucket.get("events", []) if _round_key(e) == rk]
+                evs = events_by_round[rk] if rk != -1 else keyed_minus_one
                 add_fact(
                     "ROUND_SWING",
-                    bucket.get("game_index"),
+                    game_index_by_round.get(rk),
                     (rk, rk),
                     evs,
                     "medium",
@@ -482,23 +749,23 @@ def compress_events_to_facts(series_id: str, events: List[RawEvent]) -> List[Dic
                 )
         # objective loss chain detection accumulation happens after loop
 
-    for team_id, rounds_lost in loss_chain.items():
-        if len(rounds_lost) >= 2:
+    for team_id, (first, last, lost) in loss_chain.items():
+        if lost >= 2:
             add_fact(
                 "OBJECTIVE_LOSS_CHAIN",
                 None,
-                (rounds_lost[0], rounds_lost[-1]),
+                (first, last),
                 [],
                 "medium",
-                note=f"team {team_id} lost {len(rounds_lost)} objective rounds",
+                note=f"team {team_id} lost {lost} objective rounds",
             )
 
-    for team_id, rounds_high in death_surplus_chain.items():
-        if len(rounds_high) >= 3:
+    for team_id, (first, last, high) in death_surplus_chain.items():
+        if high >= 3:
             add_fact(
                 "HIGH_RISK_SEQUENCE",
                 None,
-                (rounds_high[0], rounds_high[-1]),
+                (first, last),
                 [],
                 "medium",
                 note=f"team {team_id} deaths >> kills",
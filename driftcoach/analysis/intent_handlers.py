@@ -9,9 +9,12 @@ Each intent is handled by an independent handler, making the system:
 
 from __future__ import annotations
 
+import logging
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 
 from driftcoach.config.bounds import SystemBounds, DEFAULT_BOUNDS
 from driftcoach.analysis.answer_synthesizer import (
@@ -20,10 +23,32 @@ from driftcoach.analysis.answer_synthesizer import (
     _support_strings,
     _counter_strings,
     _limit_followups,
+    _swings_across_segments,
 )
+from driftcoach.analysis.budget_controller import (
+    BudgetController,
+    create_initial_state,
+    create_default_target,
+)
+from driftcoach.specs.spec_schema import RISK_SPEC
+
+logger = logging.getLogger(__name__)
+
+# decision_mapper imports synthesizer_router, which imports this module, so the
+# shared mapper is resolved on first use instead of at import time.
+_DECISION_MAPPER = None
+
 
+def _decision_mapper():
+    global _DECISION_MAPPER
+    if _DECISION_MAPPER is None:
+        from driftcoach.analysis.decision_mapper import _DEFAULT_MAPPER
 
-@dataclass
+        _DECISION_MAPPER = _DEFAULT_MAPPER
+    return _DECISION_MAPPER
+
+
+@dataclass(slots=True)
 class HandlerContext:
     """
     Context passed to each handler.
@@ -32,14 +57,21 @@ class HandlerContext:
     input: AnswerInput
     bounds: SystemBounds
     intent: str
+    # id(fact) -> formatted string; lives as long as the context (one synthesis)
+    fmt_cache: Dict[int, str] = field(default_factory=dict)
+    # input.facts resolved once, so a None input does not allocate a dict per access
+    _facts: Dict[str, List[Dict[str, Any]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._facts = self.input.facts or {}
 
     @property
     def facts(self) -> Dict[str, List[Dict[str, Any]]]:
-        return self.input.facts or {}
+        return self._facts
 
     def get_facts(self, fact_type: str) -> List[Dict[str, Any]]:
         """Get facts of a specific type."""
-        return self.facts.get(fact_type, [])
+        return self._facts.get(fact_type, [])
 
     def has_facts(self, fact_type: str, min_count: int = 1) -> bool:
         """Check if there are enough facts of a type."""
@@ -56,7 +88,10 @@ class IntentHandler(ABC):
     3. Respects the global bounds
     """
 
-    @abstractmethod
+    # Intents this handler answers; the synthesizer indexes these for O(1) routing.
+    # Handlers that decide dynamically leave it empty and override can_handle.
+    handled_intents: FrozenSet[str] = frozenset()
+
     def can_handle(self, intent: str) -> bool:
         """
         Check if this handler can process the given intent.
@@ -67,7 +102,7 @@ class IntentHandler(ABC):
         Returns:
             True if this handler can process the intent
         """
-        pass
+        return intent in self.handled_intents
 
     @abstractmethod
     def process(self, ctx: HandlerContext) -> AnswerSynthesisResult:
@@ -82,6 +117,35 @@ class IntentHandler(ABC):
         """
         pass
 
+    # Fixed no-evidence answer as (claim, verdict, confidence, counter_facts, followups);
+    # None when the handler has no fixed empty answer.
+    empty_answer: Optional[Tuple[str, str, float, Tuple[str, ...], Tuple[str, ...]]] = None
+
+    # Handlers whose process() logs metrics even without facts set this, so the
+    # synthesizer always calls process() instead of returning empty_result().
+    has_side_effects: bool = False
+
+    def empty_result(self, ctx: HandlerContext) -> Optional[AnswerSynthesisResult]:
+        """
+        Answer for an input with no facts at all.
+
+        The synthesizer returns this without calling process() unless the
+        handler has_side_effects; handlers that have no fixed empty answer
+        return None. Each call gets its own lists.
+        """
+        template = self.empty_answer
+        if template is None:
+            return None
+        claim, verdict, confidence, counter_facts, followups = template
+        return AnswerSynthesisResult(
+            claim=claim,
+            verdict=verdict,
+            confidence=confidence,
+            support_facts=[],
+            counter_facts=list(counter_facts),
+            followups=list(followups),
+        )
+
     def get_support_facts(
         self,
         ctx: HandlerContext,
@@ -89,15 +153,8 @@ class IntentHandler(ABC):
         limit: Optional[int] = None
     ) -> List[str]:
         """Extract support facts from specified types."""
-        all_facts = []
-        for ft in fact_types:
-            all_facts.extend(ctx.get_facts(ft))
-
-        return _support_strings(
-            all_facts,
-            limit=limit or ctx.bounds.max_support_facts,
-            bounds=ctx.bounds
-        )
+        limit = limit or ctx.bounds.max_support_facts
+        return self.format_support(ctx, self._collect(ctx, fact_types, limit), limit)
 
     def get_counter_facts(
         self,
@@ -106,16 +163,54 @@ class IntentHandler(ABC):
         limit: Optional[int] = None
     ) -> List[str]:
         """Extract counter facts from specified types."""
-        all_facts = []
-        for ft in fact_types:
-            all_facts.extend(ctx.get_facts(ft))
+        limit = limit or ctx.bounds.max_counter_facts
+        return self.format_counter(ctx, self._collect(ctx, fact_types, limit), limit)
 
+    def format_support(
+        self,
+        ctx: HandlerContext,
+        facts: List[Dict[str, Any]],
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """Format an already-fetched fact list as support strings."""
+        return _support_strings(
+            facts,
+            limit=limit or ctx.bounds.max_support_facts,
+            bounds=ctx.bounds,
+            cache=ctx.fmt_cache,
+        )
+
+    def format_counter(
+        self,
+        ctx: HandlerContext,
+        facts: List[Dict[str, Any]],
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """Format an already-fetched fact list as counter strings."""
         return _counter_strings(
-            all_facts,
+            facts,
             limit=limit or ctx.bounds.max_counter_facts,
-            bounds=ctx.bounds
+            bounds=ctx.bounds,
+            cache=ctx.fmt_cache,
         )
 
+    @staticmethod
+    def _collect(
+        ctx: HandlerContext, fact_types: List[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        # Single type: hand back the stored list instead of copying it.
+        if len(fact_types) == 1:
+            return ctx.get_facts(fact_types[0])
+        # Only the first `limit` facts are formatted, so copy no further.
+        return list(islice(chain.from_iterable(map(ctx.get_facts, fact_types)), limit))
+
+
+# Confidence by mined-fact count (index = count, clamped at the last entry)
+_HRS_CONFIDENCE = (0.0, 0.6, 0.9)
+_SWING_CONFIDENCE = (0.0, 0.35, 0.35, 0.55, 0.55, 0.75)
+_HRS_CONFIDENCE_CAP = len(_HRS_CONFIDENCE) - 1
+_SWING_CONFIDENCE_CAP = len(_SWING_CONFIDENCE) - 1
+
 
 class RiskAssessmentHandler(IntentHandler):
     """
@@ -123,19 +218,31 @@ class RiskAssessmentHandler(IntentHandler):
     Intent: "RISK_ASSESSMENT"
     """
 
-    def can_handle(self, intent: str) -> bool:
-        return intent == "RISK_ASSESSMENT"
+    handled_intents = frozenset({"RISK_ASSESSMENT"})
+    empty_answer = (
+        "当前数据不足以评估风险水平（完全无可用证据）",
+        "INSUFFICIENT",
+        0.3,
+        ("HIGH_RISK_SEQUENCE=0", "ROUND_SWING=0"),
+        ("补充更多局数的风险片段", "核查关键局的输分原因"),
+    )
+
+    # process() logs DEBUG_ENV / BC_METRICS / SHADOW_METRICS on every call
+    has_side_effects = True
+
+    # RISK_SPEC and the stopping target are module constants; read them once here.
+    # The controller and target hold no per-call state, so they are shared too.
+    _spec_fact_types = tuple(RISK_SPEC.required_evidence.primary_fact_types)
+    _max_facts_per_type = RISK_SPEC.budget.max_facts_per_type
+    _controller = BudgetController()
+    _target = create_default_target(target_confidence=0.7)
 
     def process(self, ctx: HandlerContext) -> AnswerSynthesisResult:
         # ✅ Phase 2: Spec 收缩可见性
         # 只使用 RISK_SPEC 允许的 facts
-        from driftcoach.specs.spec_schema import SpecRecognizer, RISK_SPEC
 
         # ✅ L5: BudgetController - CLRS Chapter 5 rational stopping
         # 🔧 Toggle: Set environment variable BUDGET_CONTROLLER_ENABLED=false to disable
-        import os
-        import logging
-        logger = logging.getLogger(__name__)
 
         # 🔍 DEBUG: Log environment variables for troubleshooting
         bc_raw = os.getenv("BUDGET_CONTROLLER_ENABLED", "NOT_SET")
@@ -149,72 +256,34 @@ class RiskAssessmentHandler(IntentHandler):
         logger.warning(f"🔍 DEBUG_EVAL: budget_controller_enabled={budget_controller_enabled}")
         logger.warning(f"🔍 DEBUG_EVAL: shadow_mode={shadow_mode}")
 
-        if budget_controller_enabled or shadow_mode:
-            from driftcoach.analysis.budget_controller import (
-                BudgetController,
-                BudgetState,
-                ConfidenceTarget,
-                create_initial_state,
-                create_default_target,
-            )
-
         # 获取所有 facts（按类型分组）
-        all_facts_by_type = {}
-        for fact_type in RISK_SPEC.required_evidence.primary_fact_types:
-            all_facts_by_type[fact_type] = ctx.get_facts(fact_type)
+        all_facts_by_type = {fact_type: ctx.get_facts(fact_type) for fact_type in self._spec_fact_types}
 
         # 应用 spec budget
-        max_facts = RISK_SPEC.budget.max_facts_per_type
+        max_facts = self._max_facts_per_type
 
-        # 创建 fact 候选列表（按优先级排序）
+        # 候选 facts（按优先级排序）
         # 优先级：HIGH_RISK_SEQUENCE > ROUND_SWING > ECO_COLLAPSE_SEQUENCE
-        fact_candidates = []
-        fact_candidates.extend([
-            ("HIGH_RISK_SEQUENCE", f)
-            for f in all_facts_by_type.get("HIGH_RISK_SEQUENCE", [])[:max_facts]
-        ])
-        fact_candidates.extend([
-            ("ROUND_SWING", f)
-            for f in all_facts_by_type.get("ROUND_SWING", [])[:max_facts]
-        ])
-        fact_candidates.extend([
-            ("ECO_COLLAPSE_SEQUENCE", f)
-            for f in all_facts_by_type.get("ECO_COLLAPSE_SEQUENCE", [])[:max_facts]
-        ])
+        hrs_pool = all_facts_by_type.get("HIGH_RISK_SEQUENCE", [])[:max_facts]
+        swing_pool = all_facts_by_type.get("ROUND_SWING", [])[:max_facts]
+        eco_pool = all_facts_by_type.get("ECO_COLLAPSE_SEQUENCE", [])[:max_facts]
+        candidate_count = len(hrs_pool) + len(swing_pool) + len(eco_pool)
 
         # ✅ Shadow Mode: 同时运行两个分支并记录 metrics
         if shadow_mode:
             logger.warning("🔍 SHADOW_MODE_ENABLED: Running both WITH and WITHOUT BudgetController")
 
             # Branch 1: WITH BudgetController
-            controller = BudgetController()
             budget = ctx.bounds.max_findings_total
-            state_with = create_initial_state(initial_confidence=0.0, budget=budget)
-            target = create_default_target(target_confidence=0.7)
-
-            mined_hrs_with = []
-            mined_swings_with = []
-
-            for fact_type, fact in fact_candidates:
-                if not controller.should_continue(state_with, target):
-                    break
-                if fact_type == "HIGH_RISK_SEQUENCE":
-                    mined_hrs_with.append(fact)
-                elif fact_type == "ROUND_SWING":
-                    mined_swings_with.append(fact)
-                state_with.facts_mined += 1
-                state_with.remaining_budget -= 1
-                new_conf = self._calculate_confidence(mined_hrs_with, mined_swings_with)
-                state_with.update_confidence(new_conf)
+            state_with = create_initial_state(initial_confidence=0.0, budget=budget, target=self._target)
+
+            mined_hrs_with, mined_swings_with, _ = self._mine_with_budget(
+                self._controller, state_with, self._target, hrs_pool, swing_pool, eco_pool
+            )
 
             # Branch 2: WITHOUT BudgetController (baseline)
-            mined_hrs_without = []
-            mined_swings_without = []
-            for fact_type, fact in fact_candidates:
-                if fact_type == "HIGH_RISK_SEQUENCE":
-                    mined_hrs_without.append(fact)
-                elif fact_type == "ROUND_SWING":
-                    mined_swings_without.append(fact)
+            mined_hrs_without = hrs_pool
+            mined_swings_without = swing_pool
 
             # 记录 Shadow Metrics
             shadow_metrics = {
@@ -229,7 +298,7 @@ class RiskAssessmentHandler(IntentHandler):
                     "swings": len(mined_swings_with),
                     "confidence": state_with.current_confidence,
                     "steps": state_with.facts_mined,
-                    "stopped_early": state_with.facts_mined < len(fact_candidates),
+                    "stopped_early": state_with.facts_mined < candidate_count,
                 },
                 "efficiency": {
                     "facts_saved": (len(mined_hrs_without) + len(mined_swings_without)) - (len(mined_hrs_with) + len(mined_swings_with)),
@@ -245,45 +314,21 @@ class RiskAssessmentHandler(IntentHandler):
 
         elif budget_controller_enabled:
             # ✅ L5 核心循环：逐步挖掘，理性停止
-            # 初始化 BudgetController
-            controller = BudgetController()
             # Use max_findings_total as budget (L3 constraint)
             budget = ctx.bounds.max_findings_total
-            state = create_initial_state(initial_confidence=0.0, budget=budget)
-            target = create_default_target(target_confidence=0.7)
+            state = create_initial_state(initial_confidence=0.0, budget=budget, target=self._target)
 
             # 已挖掘的 facts（按类型分组）
-            mined_hrs = []
-            mined_swings = []
-            mined_eco = []
-
-            for fact_type, fact in fact_candidates:
-                # 检查是否应该继续
-                if not controller.should_continue(state, target):
-                    break
-
-                # "挖掘"这个 fact（添加到已挖掘列表）
-                if fact_type == "HIGH_RISK_SEQUENCE":
-                    mined_hrs.append(fact)
-                elif fact_type == "ROUND_SWING":
-                    mined_swings.append(fact)
-                elif fact_type == "ECO_COLLAPSE_SEQUENCE":
-                    mined_eco.append(fact)
-
-                # 更新状态
-                state.facts_mined += 1
-                state.remaining_budget -= 1
-
-                # 计算新的 confidence（基于当前已挖掘的 facts）
-                new_confidence = self._calculate_confidence(mined_hrs, mined_swings)
-                state.update_confidence(new_confidence)
+            mined_hrs, mined_swings, mined_eco = self._mine_with_budget(
+                self._controller, state, self._target, hrs_pool, swing_pool, eco_pool
+            )
 
             # 📊 Production Monitoring: Log BudgetController metrics
-            stopped_early = state.facts_mined < len(fact_candidates)
+            stopped_early = state.facts_mined < candidate_count
             logger.warning(
                 f"📊 BC_METRICS: mode=PROD, "
                 f"facts_used={state.facts_mined}, "
-                f"facts_available={len(fact_candidates)}, "
+                f"facts_available={candidate_count}, "
                 f"hrs={len(mined_hrs)}, "
                 f"swings={len(mined_swings)}, "
                 f"confidence={state.current_confidence:.2f}, "
@@ -292,16 +337,9 @@ class RiskAssessmentHandler(IntentHandler):
             )
         else:
             # ❌ BudgetController 禁用：使用所有可用 facts（原行为）
-            mined_hrs = []
-            mined_swings = []
-            mined_eco = []
-            for fact_type, fact in fact_candidates:
-                if fact_type == "HIGH_RISK_SEQUENCE":
-                    mined_hrs.append(fact)
-                elif fact_type == "ROUND_SWING":
-                    mined_swings.append(fact)
-                elif fact_type == "ECO_COLLAPSE_SEQUENCE":
-                    mined_eco.append(fact)
+            mined_hrs = hrs_pool
+            mined_swings = swing_pool
+            mined_eco = eco_pool
 
         # 循环结束 → 使用已挖掘的 facts 生成决策
         # 优先级判断
@@ -328,8 +366,6 @@ class RiskAssessmentHandler(IntentHandler):
         else:
             # KEY: Always provide a degraded answer if ANY evidence exists
             # Use DecisionMapper to generate degraded decision
-            from driftcoach.analysis.decision_mapper import DecisionMapper, DecisionPath
-
             available_facts = mined_hrs + mined_swings
 
             if available_facts:
@@ -342,7 +378,7 @@ class RiskAssessmentHandler(IntentHandler):
                     }
                 }
 
-                mapper = DecisionMapper()
+                mapper = _decision_mapper()
                 decision = mapper.map_to_decision(
                     context=context,
                     intent=ctx.intent,
@@ -361,17 +397,53 @@ class RiskAssessmentHandler(IntentHandler):
                 )
             else:
                 # Truly no evidence → explicit rejection
-                return AnswerSynthesisResult(
-                    claim="当前数据不足以评估风险水平（完全无可用证据）",
-                    verdict="INSUFFICIENT",
-                    confidence=0.3,
-                    support_facts=[],
-                    counter_facts=[
-                        f"HIGH_RISK_SEQUENCE={len(mined_hrs)}",
-                        f"ROUND_SWING={len(mined_swings)}"
-                    ],
-                    followups=["补充更多局数的风险片段", "核查关键局的输分原因"]
-                )
+                return self.empty_result(ctx)
+
+    def _mine_with_budget(
+        self,
+        controller: BudgetController,
+        state,
+        target,
+        hrs_pool: list,
+        swing_pool: list,
+        eco_pool: list,
+    ) -> tuple:
+        """
+        Mine facts pool by pool in priority order until the controller stops.
+
+        Returns:
+            (mined_hrs, mined_swings, mined_eco)
+        """
+        mined_hrs: list = []
+        mined_swings: list = []
+        mined_eco: list = []
+        # Confidence only moves while a contributing count is inside its table
+        # (ECO_COLLAPSE_SEQUENCE never contributes), so past that the last value
+        # is reused. update_confidence still runs every step: the controller's
+        # convergence check counts the repeated values.
+        confidence = self._calculate_confidence(mined_hrs, mined_swings)
+        for pool, mined, cap in (
+            (hrs_pool, mined_hrs, _HRS_CONFIDENCE_CAP),
+            (swing_pool, mined_swings, _SWING_CONFIDENCE_CAP),
+            (eco_pool, mined_eco, -1),
+        ):
+            for fact in pool:
+                # 检查是否应该继续
+                if not controller.should_continue(state, target):
+                    return mined_hrs, mined_swings, mined_eco
+
+                # "挖掘"这个 fact（添加到已挖掘列表）
+                mined.append(fact)
+
+                # 更新状态
+                state.facts_mined += 1
+                state.remaining_budget -= 1
+
+                # 计算新的 confidence（基于当前已挖掘的 facts）
+                if len(mined) <= cap:
+                    confidence = self._calculate_confidence(mined_hrs, mined_swings)
+                state.update_confidence(confidence)
+        return mined_hrs, mined_swings, mined_eco
 
     def _calculate_confidence(self, hrs: list, swings: list) -> float:
         """
@@ -387,24 +459,11 @@ class RiskAssessmentHandler(IntentHandler):
         Returns:
             Estimated confidence (0.0 to 1.0)
         """
-        # Start with base confidence
-        confidence = 0.0
-
-        # HIGH_RISK_SEQUENCE contributes strongly
-        if len(hrs) >= 2:
-            confidence = max(confidence, 0.9)
-        elif len(hrs) >= 1:
-            confidence = max(confidence, 0.6)
-
-        # ROUND_SWING contributes moderately
-        if len(swings) >= 5:
-            confidence = max(confidence, 0.75)
-        elif len(swings) >= 3:
-            confidence = max(confidence, 0.55)
-        elif len(swings) >= 1:
-            confidence = max(confidence, 0.35)
-
-        return confidence
+        # HIGH_RISK_SEQUENCE contributes strongly, ROUND_SWING moderately
+        return max(
+            _HRS_CONFIDENCE[min(len(hrs), _HRS_CONFIDENCE_CAP)],
+            _SWING_CONFIDENCE[min(len(swings), _SWING_CONFIDENCE_CAP)],
+        )
 
     def _format_facts(self, facts: list) -> List[str]:
         """
@@ -421,12 +480,16 @@ class RiskAssessmentHandler(IntentHandler):
 
         result = []
         for fact in facts[:3]:  # Limit to 3 facts
-            note = fact.get("note", "")
+            pieces = []
+            r = fact.get("round")
+            if r:
+                pieces.append(f"R{r}")
             rr = fact.get("round_range", [])
-            rr_str = f"R{rr[0]}-R{rr[1]}" if len(rr) == 2 else ""
-            r = fact.get("round", "")
-            r_str = f"R{r}" if r else ""
-            pieces = [p for p in [r_str, rr_str, note] if p]
+            if len(rr) == 2:
+                pieces.append(f"R{rr[0]}-R{rr[1]}")
+            note = fact.get("note")
+            if note:
+                pieces.append(note)
             result.append(" | ".join(pieces) if pieces else fact.get("fact_type", "fact"))
 
         return result
@@ -438,8 +501,14 @@ class EconomicCounterfactualHandler(IntentHandler):
     Intent: "ECONOMIC_COUNTERFACTUAL"
     """
 
-    def can_handle(self, intent: str) -> bool:
-        return intent == "ECONOMIC_COUNTERFACTUAL"
+    handled_intents = frozenset({"ECONOMIC_COUNTERFACTUAL"})
+    empty_answer = (
+        "缺少经济事件数据，无法判断强起/保枪效果",
+        "INSUFFICIENT",
+        0.3,
+        ("FORCE_BUY_ROUND=0", "ECO_COLLAPSE_SEQUENCE=0", "FULL_BUY_ROUND=0"),
+        ("补充关键强起回合的经济明细", "核查失分与强起回合的对应关系"),
+    )
 
     def process(self, ctx: HandlerContext) -> AnswerSynthesisResult:
         force_buy = ctx.get_facts("FORCE_BUY_ROUND")
@@ -451,9 +520,8 @@ class EconomicCounterfactualHandler(IntentHandler):
                 claim="强起决策很可能放大了风险，保枪可能更优",
                 verdict="YES",
                 confidence=0.82,
-                support_facts=(
-                    self.get_support_facts(ctx, ["FORCE_BUY_ROUND"], limit=1) +
-                    self.get_support_facts(ctx, ["ECO_COLLAPSE_SEQUENCE"], limit=1)
+                support_facts=self.format_support(
+                    ctx, force_buy[:1] + eco_collapse[:1], limit=2
                 ),
                 counter_facts=[],
                 followups=[]
@@ -464,8 +532,8 @@ class EconomicCounterfactualHandler(IntentHandler):
                 claim="即使保枪，结果也未必会更好",
                 verdict="NO",
                 confidence=0.55,
-                support_facts=self.get_support_facts(ctx, ["FULL_BUY_ROUND"]),
-                counter_facts=self.get_support_facts(ctx, ["FORCE_BUY_ROUND"]),
+                support_facts=self.format_support(ctx, full_buy),
+                counter_facts=self.format_support(ctx, force_buy),
                 followups=[]
             )
 
@@ -475,8 +543,6 @@ class EconomicCounterfactualHandler(IntentHandler):
 
             if available_facts:
                 # Use DecisionMapper for degraded decision
-                from driftcoach.analysis.decision_mapper import DecisionMapper
-
                 context = {
                     "schema": {"outcome_field": "NOT_FOUND"},
                     "evidence": {
@@ -485,7 +551,7 @@ class EconomicCounterfactualHandler(IntentHandler):
                     }
                 }
 
-                mapper = DecisionMapper()
+                mapper = _decision_mapper()
                 decision = mapper.map_to_decision(
                     context=context,
                     intent=ctx.intent,
@@ -507,18 +573,7 @@ class EconomicCounterfactualHandler(IntentHandler):
                 )
             else:
                 # No economic data at all
-                return AnswerSynthesisResult(
-                    claim="缺少经济事件数据，无法判断强起/保枪效果",
-                    verdict="INSUFFICIENT",
-                    confidence=0.3,
-                    support_facts=[],
-                    counter_facts=[
-                        f"FORCE_BUY_ROUND={len(force_buy)}",
-                        f"ECO_COLLAPSE_SEQUENCE={len(eco_collapse)}",
-                        f"FULL_BUY_ROUND={len(full_buy)}"
-                    ],
-                    followups=["补充关键强起回合的经济明细", "核查失分与强起回合的对应关系"]
-                )
+                return self.empty_result(ctx)
 
 
 class MomentumAnalysisHandler(IntentHandler):
@@ -527,8 +582,14 @@ class MomentumAnalysisHandler(IntentHandler):
     Intents: "MOMENTUM_ANALYSIS", "MOMENTUM_SHIFT"
     """
 
-    def can_handle(self, intent: str) -> bool:
-        return intent in {"MOMENTUM_ANALYSIS", "MOMENTUM_SHIFT"}
+    handled_intents = frozenset({"MOMENTUM_ANALYSIS", "MOMENTUM_SHIFT"})
+    empty_answer = (
+        "未发现能改变局势的反转",
+        "NO",
+        0.45,
+        ("ROUND_SWING=0",),
+        ("检查关键局的开局/收官表现",),
+    )
 
     def process(self, ctx: HandlerContext) -> AnswerSynthesisResult:
         swings = ctx.get_facts("ROUND_SWING")
@@ -538,19 +599,12 @@ class MomentumAnalysisHandler(IntentHandler):
                 claim="比赛中出现过关键的局势反转",
                 verdict="YES",
                 confidence=0.78,
-                support_facts=self.get_support_facts(ctx, ["ROUND_SWING"]),
+                support_facts=self.format_support(ctx, swings),
                 counter_facts=[],
                 followups=[]
             )
         else:
-            return AnswerSynthesisResult(
-                claim="未发现能改变局势的反转",
-                verdict="NO",
-                confidence=0.45,
-                support_facts=[],
-                counter_facts=["ROUND_SWING=0"],
-                followups=["检查关键局的开局/收官表现"]
-            )
+            return self.empty_result(ctx)
 
 
 class StabilityAnalysisHandler(IntentHandler):
@@ -559,12 +613,16 @@ class StabilityAnalysisHandler(IntentHandler):
     Intents: "STABILITY_ANALYSIS", "STABILITY_CHECK"
     """
 
-    def can_handle(self, intent: str) -> bool:
-        return intent in {"STABILITY_ANALYSIS", "STABILITY_CHECK"}
+    handled_intents = frozenset({"STABILITY_ANALYSIS", "STABILITY_CHECK"})
+    empty_answer = (
+        "局势反转更像偶发事件",
+        "NO",
+        0.4,
+        ("未提炼到 ROUND_SWING",),
+        ("补充其他地图/局段的 swing 事件",),
+    )
 
     def process(self, ctx: HandlerContext) -> AnswerSynthesisResult:
-        from driftcoach.analysis.answer_synthesizer import _swings_across_segments
-
         swings = ctx.get_facts("ROUND_SWING")
         repeated = len(swings) >= 3 and _swings_across_segments(swings)
 
@@ -573,7 +631,7 @@ class StabilityAnalysisHandler(IntentHandler):
                 claim="局势反转在多局段反复出现",
                 verdict="YES",
                 confidence=0.76,
-                support_facts=self.get_support_facts(ctx, ["ROUND_SWING"]),
+                support_facts=self.format_support(ctx, swings),
                 counter_facts=[],
                 followups=[]
             )
@@ -582,7 +640,7 @@ class StabilityAnalysisHandler(IntentHandler):
                 claim="局势反转更像偶发事件",
                 verdict="NO",
                 confidence=0.52 if swings else 0.4,
-                support_facts=self.get_support_facts(ctx, ["ROUND_SWING"]),
+                support_facts=self.format_support(ctx, swings),
                 counter_facts=(
                     ["未提炼到 ROUND_SWING"] if not swings
                     else ["集中于单一局段，缺少跨局分布"]
@@ -597,8 +655,14 @@ class CollapseOnsetHandler(IntentHandler):
     Intent: "COLLAPSE_ONSET_ANALYSIS"
     """
 
-    def can_handle(self, intent: str) -> bool:
-        return intent == "COLLAPSE_ONSET_ANALYSIS"
+    handled_intents = frozenset({"COLLAPSE_ONSET_ANALYSIS"})
+    empty_answer = (
+        "缺少经济崩盘相关事件",
+        "INSUFFICIENT",
+        0.3,
+        ("ECO_COLLAPSE_SEQUENCE=0", "ROUND_SWING=0"),
+        ("补充经济事件文件", "核查关键输分后的经济状态"),
+    )
 
     def process(self, ctx: HandlerContext) -> AnswerSynthesisResult:
         eco = ctx.get_facts("ECO_COLLAPSE_SEQUENCE")
@@ -609,8 +673,8 @@ class CollapseOnsetHandler(IntentHandler):
                 claim="出现过经济崩盘/断档的起点，需要控制经济节奏",
                 verdict="YES",
                 confidence=0.78,
-                support_facts=self.get_support_facts(ctx, ["ECO_COLLAPSE_SEQUENCE"]),
-                counter_facts=self.get_support_facts(ctx, ["ROUND_SWING"]),
+                support_facts=self.format_support(ctx, eco),
+                counter_facts=self.format_support(ctx, swings),
                 followups=[]
             )
 
@@ -619,23 +683,13 @@ class CollapseOnsetHandler(IntentHandler):
                 claim="有局势波动，但尚不足以定位经济崩盘起点",
                 verdict="INSUFFICIENT",
                 confidence=0.45,
-                support_facts=self.get_support_facts(ctx, ["ROUND_SWING"]),
+                support_facts=self.format_support(ctx, swings),
                 counter_facts=[],
                 followups=["补充经济明细（loadout/money）以定位崩盘回合"]
             )
 
         else:
-            return AnswerSynthesisResult(
-                claim="缺少经济崩盘相关事件",
-                verdict="INSUFFICIENT",
-                confidence=0.3,
-                support_facts=[],
-                counter_facts=[
-                    "ECO_COLLAPSE_SEQUENCE=0",
-                    "ROUND_SWING=0"
-                ],
-                followups=["补充经济事件文件", "核查关键输分后的经济状态"]
-            )
+            return self.empty_result(ctx)
 
 
 # TODO: Add remaining handlers
@@ -652,24 +706,31 @@ class FallbackHandler(IntentHandler):
     Attempts to provide a degraded answer based on any available facts.
     """
 
+    empty_answer = (
+        "缺少对应规则，无法生成结论",
+        "INSUFFICIENT",
+        0.2,
+        (),
+        ("补充意图映射或规则",),
+    )
+
     def can_handle(self, intent: str) -> bool:
         return True  # Can handle any intent (fallback)
 
     def process(self, ctx: HandlerContext) -> AnswerSynthesisResult:
         # Try to extract any available facts
-        all_facts = []
-        for fact_type, facts in ctx.facts.items():
-            all_facts.extend(facts)
+        facts = ctx.facts
+        fact_count = sum(map(len, facts.values()))
 
-        if all_facts:
+        if fact_count:
             # Degraded decision
             return AnswerSynthesisResult(
-                claim=f"基于有限数据的初步分析（{len(all_facts)}条证据）",
+                claim=f"基于有限数据的初步分析（{fact_count}条证据）",
                 verdict="LOW_CONFIDENCE",
                 confidence=0.35,
                 support_facts=self.get_support_facts(
                     ctx,
-                    list(ctx.facts.keys())[:3]
+                    list(islice(facts, 3))
                 ),
                 counter_facts=[
                     "缺少对应规则",
@@ -678,11 +739,4 @@ class FallbackHandler(IntentHandler):
                 followups=["补充意图映射或规则"]
             )
         else:
-            return AnswerSynthesisResult(
-                claim="缺少对应规则，无法生成结论",
-                verdict="INSUFFICIENT",
-                confidence=0.2,
-                support_facts=[],
-                counter_facts=[],
-                followups=["补充意图映射或规则"]
-            )
+            return self.empty_result(ctx)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, List, Sequence, Any
+import functools
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
 from driftcoach.analysis.registry import AnalysisMethod
@@ -9,8 +11,15 @@ from driftcoach.outputs.distribution_insight import DistributionInsight
 
 
 def _time_bucket(ts: str | None) -> str:
-    if not ts:
+    # fromisoformat only takes str, so anything else buckets as UNKNOWN
+    if not ts or not isinstance(ts, str):
         return "UNKNOWN"
+    return _month_bucket(ts)
+
+
+# states from one series share a handful of start times, so parse each once
+@functools.lru_cache(maxsize=4096)
+def _month_bucket(ts: str) -> str:
     try:
         cleaned = ts.replace("Z", "+00:00") if ts.endswith("Z") else ts
         dt = datetime.fromisoformat(cleaned)
@@ -19,85 +28,53 @@ def _time_bucket(ts: str | None) -> str:
         return "UNKNOWN"
 
 
-def _build_buckets(states: Sequence[State]) -> Dict[str, Dict[str, int]]:
-    buckets: Dict[str, Dict[str, int]] = {
-        "format": {},
-        "tournament": {},
-        "time_bucket": {},
-        "opponent": {},
-    }
+# a scope covers a few matchups, each repeated on every state of its series
+@functools.lru_cache(maxsize=1024)
+def _opponent_label(names: Tuple[str, ...]) -> str:
+    return " vs ".join(sorted(names))
 
-    for s in states:
-        extras = s.extras or {}
-        if extras.get("evidence_type") != "CONTEXT_ONLY":
-            continue
-
-        fmt = (extras.get("format") or "UNKNOWN").upper()
-        tournament = extras.get("tournament") or "UNKNOWN"
-        t_bucket = _time_bucket(extras.get("start_time"))
-
-        opponents = extras.get("team_names") if isinstance(extras, dict) else None
-        if isinstance(opponents, list) and opponents:
-            opp_label = " vs ".join(sorted(str(o) for o in opponents))
-        else:
-            opp_label = "UNKNOWN"
-
-        for key, value in (
-            ("format", fmt),
-            ("tournament", tournament),
-            ("time_bucket", t_bucket),
-            ("opponent", opp_label),
-        ):
-            buckets[key][value] = buckets[key].get(value, 0) + 1
-
-    return buckets
-
-
-def _build_summary(buckets: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
-    summary: Dict[str, Any] = {
-        "coverage": {"axes": {}, "overall": False},
-        "concentration": {},
-        "bias_flags": {},
-    }
 
-    axes = ["format", "tournament", "time_bucket", "opponent"]
-    all_covered = True
+def _opponent_of(extras: Dict) -> str:
+    opponents = extras.get("team_names") if isinstance(extras, dict) else None
+    if isinstance(opponents, list) and opponents:
+        return _opponent_label(tuple(map(str, opponents)))
+    return "UNKNOWN"
 
-    for axis in axes:
-        axis_buckets = buckets.get(axis) or {}
-        total = sum(axis_buckets.values())
-        covered = total > 0
-        summary["coverage"]["axes"][axis] = covered
-        all_covered = all_covered and covered
 
-        if total <= 0:
-            summary["concentration"][axis] = {"top1": 0.0, "top3": 0.0, "total": 0}
-            summary["bias_flags"][axis] = False
-            continue
-
-        sorted_counts = sorted(axis_buckets.values(), reverse=True)
-        top1 = sorted_counts[0]
-        top3 = sum(sorted_counts[:3])
-        summary["concentration"][axis] = {
-            "top1": round(top1 / total, 4),
-            "top3": round(top3 / total, 4),
-            "total": total,
-        }
+def _build_buckets(states: Sequence[State]) -> Dict[str, Dict[str, int]]:
+    # One filter pass, then one column per axis; Counter tallies each column in C.
+    context = [
+        extras
+        for extras in (s.extras for s in states)
+        if extras and extras.get("evidence_type") == "CONTEXT_ONLY"
+    ]
+    return {
+        "format": Counter([(e.get("format") or "UNKNOWN").upper() for e in context]),
+        "tournament": Counter([e.get("tournament") or "UNKNOWN" for e in context]),
+        "time_bucket": Counter([_time_bucket(e.get("start_time")) for e in context]),
+        "opponent": Counter([_opponent_of(e) for e in context]),
+    }
+
 
-        bias_threshold = 0.6
-        summary["bias_flags"][axis] = (top1 / total) >= bias_threshold
+_AXES = ("format", "tournament", "time_bucket", "opponent")
+_BIAS_THRESHOLD = 0.6
 
-    summary["coverage"]["overall"] = all_covered
-    return summary
 
+def _biased_axes(buckets: Dict[str, Dict[str, int]]) -> Optional[List[str]]:
+    """
+    Coverage and bias in one pass over the axes.
 
-def _axes_with_bias(summary: Dict[str, Any]) -> List[str]:
-    axes = []
-    conc = summary.get("concentration", {})
-    bias = summary.get("bias_flags", {})
-    for axis, stats in conc.items():
-        top1 = stats.get("top1", 0)
-        if top1 >= 0.6 or bias.get(axis):
+    Returns None when any axis has no samples (no overall coverage), otherwise
+    the axes whose top bucket holds at least 60% of the samples.
+    """
+    axes: List[str] = []
+    for axis in _AXES:
+        axis_buckets = buckets.get(axis) or {}
+        total = sum(axis_buckets.values())
+        if total <= 0:
+            return None
+        # the reported top1 share is rounded to 4 places, so flag on that value
+        if round(max(axis_buckets.values()) / total, 4) >= _BIAS_THRESHOLD:
             axes.append(axis)
     return axes
 
@@ -111,25 +88,35 @@ class DistributionInsightMethod(AnalysisMethod):
         self.trigger_conditions = {
             "min_context_states": lambda states: any((s.extras or {}).get("evidence_type") == "CONTEXT_ONLY" for s in states),
         }
+        # (states, len(states), biased axes) from eligible() for the run() that
+        # follows it on the same sequence; run() clears it so no states outlive the call.
+        self._last_analysis: Optional[Tuple[Sequence[State], int, Optional[List[str]]]] = None
+
+    def _analyze(self, states: Sequence[State]) -> Optional[List[str]]:
+        last = self._last_analysis
+        if last is not None and last[0] is states and last[1] == len(states):
+            return last[2]
+        return _biased_axes(_build_buckets(states))
 
     def eligible(self, states: Sequence[State]) -> bool:
-        buckets = _build_buckets(states)
-        summary = _build_summary(buckets)
-        if not summary.get("coverage", {}).get("overall"):
+        # Without a single CONTEXT_ONLY state every axis is empty, so skip the
+        # bucket build; the any() scan stops at the first context state.
+        self._last_analysis = None
+        if not self.trigger_conditions["min_context_states"](states):
             return False
-        biased_axes = _axes_with_bias(summary)
-        return bool(biased_axes)
+        axes = self._analyze(states)
+        if not axes:
+            return False
+        self._last_analysis = (states, len(states), axes)
+        return True
 
     def run(self, states: Sequence[State]):
-        buckets = _build_buckets(states)
-        summary = _build_summary(buckets)
-        if not summary.get("coverage", {}).get("overall"):
-            return None
-        axes = _axes_with_bias(summary)
+        axes = self._analyze(states)
+        self._last_analysis = None
         if not axes:
             return None
         return DistributionInsight.build(
-            axes=axes,
+            axes=list(axes),
             summary_ref="context.evidence.summary",
             confidence="LOW",
             note="No outcome/stats; descriptive only",
@@ -19,17 +19,26 @@ class EconCascade(AnalysisMethod):
         return len(states) >= 20
 
     def run(self, states: Sequence[State]):
-        samples = [s for s in states if s.extras.get("round_result")]
-        if not samples:
+        # one pass, scalar counters only
+        sample_count = losses_all = total_disadvantaged = losses_disadvantaged = 0
+        for s in states:
+            result = s.extras.get("round_result")
+            if not result:
+                continue
+            sample_count += 1
+            lost = result == "LOSS"
+            if lost:
+                losses_all += 1
+            if s.econ_diff <= -2000:
+                total_disadvantaged += 1
+                if lost:
+                    losses_disadvantaged += 1
+        if not sample_count:
             return None
 
-        disadvantaged = [s for s in samples if s.econ_diff <= -2000]
-        losses_disadvantaged = sum(1 for s in disadvantaged if s.extras.get("round_result") == "LOSS")
-        total_disadvantaged = len(disadvantaged)
         cascade_rate = losses_disadvantaged / total_disadvantaged if total_disadvantaged else 0.0
 
-        losses_all = sum(1 for s in samples if s.extras.get("round_result") == "LOSS")
-        baseline = losses_all / len(samples) if samples else 0.0
+        baseline = losses_all / sample_count
 
         confidence = min(1.0, total_disadvantaged / 40.0)
 
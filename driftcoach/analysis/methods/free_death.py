@@ -19,17 +19,27 @@ class FreeDeathImpact(AnalysisMethod):
         return len(states) >= 30
 
     def run(self, states: Sequence[State]):
-        samples = [s for s in states if s.extras.get("free_death") is not None]
-        if not samples:
+        # one pass, scalar counters only
+        sample_count = wins_all = total_condition = wins_with_condition = 0
+        for s in states:
+            extras = s.extras
+            free_death = extras.get("free_death")
+            if free_death is None:
+                continue
+            sample_count += 1
+            won = extras.get("round_result") == "WIN"
+            if won:
+                wins_all += 1
+            if free_death:
+                total_condition += 1
+                if won:
+                    wins_with_condition += 1
+        if not sample_count:
             return None
 
-        condition_states = [s for s in samples if bool(s.extras.get("free_death"))]
-        wins_with_condition = sum(1 for s in condition_states if s.extras.get("round_result") == "WIN")
-        total_condition = len(condition_states)
         cond_winrate = wins_with_condition / total_condition if total_condition else 0.0
 
-        wins_all = sum(1 for s in samples if s.extras.get("round_result") == "WIN")
-        baseline = wins_all / len(samples) if samples else 0.0
+        baseline = wins_all / sample_count
 
         confidence = min(1.0, total_condition / 50.0)
 
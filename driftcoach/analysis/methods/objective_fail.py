@@ -19,17 +19,26 @@ class ObjectiveFail(AnalysisMethod):
         return len(states) >= 15
 
     def run(self, states: Sequence[State]):
-        samples = [s for s in states if s.objective_context]
-        if not samples:
+        # one pass, scalar counters only
+        sample_count = losses_all = total_contests = failures = 0
+        for s in states:
+            if not s.objective_context:
+                continue
+            sample_count += 1
+            extras = s.extras
+            lost = extras.get("round_result") == "LOSS"
+            if lost:
+                losses_all += 1
+            if extras.get("contest_attempt"):
+                total_contests += 1
+                if lost:
+                    failures += 1
+        if not sample_count:
             return None
 
-        contests = [s for s in samples if s.extras.get("contest_attempt")]
-        failures = sum(1 for s in contests if s.extras.get("round_result") == "LOSS")
-        total_contests = len(contests)
         fail_rate = failures / total_contests if total_contests else 0.0
 
-        losses_all = sum(1 for s in samples if s.extras.get("round_result") == "LOSS")
-        baseline = losses_all / len(samples) if samples else 0.0
+        baseline = losses_all / sample_count
 
         confidence = min(1.0, total_contests / 30.0)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from driftcoach.adapters.grid.file_download_client import RawEvent
 
@@ -9,19 +10,18 @@ def _normalize(s: Optional[str]) -> Optional[str]:
     return s.lower().strip() if isinstance(s, str) else None
 
 
-def _collect_players_from_series_state(series_state: Dict[str, Any]) -> List[Tuple[str, str]]:
-    players: List[Tuple[str, str]] = []
+def _collect_players_from_series_state(series_state: Dict[str, Any], target: str) -> Iterator[Tuple[str, str]]:
     for team in (series_state.get("teams") or []):
         for p in team.get("players") or []:
             pid = p.get("id")
             name = p.get("name")
             if pid and name:
-                players.append((str(pid), str(name)))
-    return players
+                name = str(name)
+                if _normalize(name) == target:
+                    yield str(pid), name
 
 
-def _collect_players_from_events(events: List[RawEvent]) -> List[Tuple[str, str]]:
-    seen: List[Tuple[str, str]] = []
+def _collect_players_from_events(events: List[RawEvent], target: str) -> Iterator[Tuple[Optional[str], str]]:
     for ev in events:
         payload = ev.payload or {}
         for key in ["actor", "target", "player", "victim", "killer", "killed"]:
@@ -30,11 +30,14 @@ def _collect_players_from_events(events: List[RawEvent]) -> List[Tuple[str, str]
                 pid = obj.get("id") or obj.get("playerId")
                 name = obj.get("name")
                 if pid and name:
-                    seen.append((str(pid), str(name)))
+                    name = str(name)
+                    if _normalize(name) == target:
+                        yield str(pid), name
             elif obj:
                 # sometimes name appears without id
-                seen.append((None, str(obj)))
-    return seen
+                name = str(obj)
+                if _normalize(name) == target:
+                    yield None, name
 
 
 def resolve_player_id(series_events: List[RawEvent], player_name: Optional[str], series_state: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[str]]:
@@ -47,32 +50,30 @@ def resolve_player_id(series_events: List[RawEvent], player_name: Optional[str],
         return None, "missing_player_name"
 
     target = _normalize(player_name)
-    candidates: List[Tuple[Optional[str], str]] = []
-
-    for pid, name in _collect_players_from_series_state(series_state or {}):
-        if _normalize(name) == target:
-            candidates.append((pid, name))
-
-    for pid, name in _collect_players_from_events(series_events or []):
-        if _normalize(name) == target:
-            candidates.append((pid, name))
-
-    # Deduplicate by id/name pair
-    dedup: Dict[Tuple[Optional[str], str], None] = {}
+    candidates = chain(
+        _collect_players_from_series_state(series_state or {}, target),
+        _collect_players_from_events(series_events or [], target),
+    )
+
+    # Distinct id/name pairs; two with an id already decide "ambiguous", so the
+    # rest of the events need not be scanned.
+    with_id: Set[Tuple[str, str]] = set()
+    without_id: Set[str] = set()
     for pid, name in candidates:
-        dedup[(pid, name)] = None
-    unique = list(dedup.keys())
+        if pid:
+            with_id.add((pid, name))
+            if len(with_id) > 1:
+                # conflicting ids for same name
+                return None, "player_ambiguous"
+        else:
+            without_id.add(name)
 
-    if not unique:
-        return None, "player_not_found"
     # prefer candidates with id present
-    with_id = [pid for pid, _ in unique if pid]
-    if len(with_id) == 1:
-        return with_id[0], None
-    if len(with_id) > 1:
-        # conflicting ids for same name
-        return None, "player_ambiguous"
+    if with_id:
+        return next(iter(with_id))[0], None
+    if not without_id:
+        return None, "player_not_found"
     # only names without ids
-    if len(unique) == 1:
+    if len(without_id) == 1:
         return None, "player_missing_id"
     return None, "player_ambiguous"
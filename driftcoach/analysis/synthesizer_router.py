@@ -4,7 +4,7 @@ Answer Synthesizer Router (Combine phase).
 Routes intents to their respective handlers using divide-and-conquer.
 """
 
-from typing import List
+from typing import Dict, List
 from driftcoach.analysis.intent_handlers import (
     IntentHandler,
     HandlerContext,
@@ -46,6 +46,7 @@ class AnswerSynthesizer:
             handlers: List of intent handlers (uses default if None)
         """
         self.handlers = handlers or self._default_handlers()
+        self._rebuild_index()
 
     def _default_handlers(self) -> List[IntentHandler]:
         """
@@ -72,6 +73,37 @@ class AnswerSynthesizer:
             FallbackHandler(),
         ]
 
+    def _rebuild_index(self) -> None:
+        """
+        Index handlers by their declared intents (first match wins).
+
+        Indexing stops at the first handler without ``handled_intents`` or
+        with its own ``can_handle`` (e.g. the fallback): from there on
+        ``can_handle`` may claim any intent, so that handler and the ones
+        after it are only reachable through the ordered scan. Handlers before
+        it answer ``can_handle`` from their declared intents alone, so an
+        intent missing from the index skips them.
+        """
+        index: Dict[str, IntentHandler] = {}
+        stop = len(self.handlers)
+        for position, handler in enumerate(self.handlers):
+            if not handler.handled_intents or type(handler).can_handle is not IntentHandler.can_handle:
+                stop = position
+                break
+            for intent in handler.handled_intents:
+                index.setdefault(intent, handler)
+        self._intent_index = index
+        self._scan_handlers = self.handlers[stop:]
+
+    def _route(self, intent: str) -> IntentHandler | None:
+        handler = self._intent_index.get(intent)
+        if handler is not None:
+            return handler
+        for handler in self._scan_handlers:
+            if handler.can_handle(intent):
+                return handler
+        return None
+
     def synthesize(
         self,
         inp: AnswerInput,
@@ -101,21 +133,32 @@ class AnswerSynthesizer:
             intent=intent
         )
 
+        max_support = bounds.max_support_facts
+        max_counter = bounds.max_counter_facts
+        max_followups = bounds.max_followup_questions
+
+        # No facts of any type: every handler has a fixed answer for that, so
+        # skip process() (and its spec/budget setup) when the handler offers one
+        # and process() has no side effects (metrics logging) to preserve.
+        no_facts = not any((inp.facts or {}).values())
+
         # Divide + Conquer: Find and execute handler
-        for handler in self.handlers:
-            if handler.can_handle(intent):
-                # Each handler processes independently
-                result = handler.process(ctx)
+        handler = self._route(intent)
+        if handler is None:
+            # Should never reach here (fallback handler handles everything)
+            raise RuntimeError(f"No handler found for intent: {intent}")
 
-                # Enforce global bounds on outputs
-                result.support_facts = result.support_facts[:bounds.max_support_facts]
-                result.counter_facts = result.counter_facts[:bounds.max_counter_facts]
-                result.followups = result.followups[:bounds.max_followup_questions]
+        result = handler.empty_result(ctx) if no_facts and not handler.has_side_effects else None
+        if result is None:
+            # Each handler processes independently
+            result = handler.process(ctx)
 
-                return result
+        # Enforce global bounds on outputs
+        result.support_facts = result.support_facts[:max_support]
+        result.counter_facts = result.counter_facts[:max_counter]
+        result.followups = result.followups[:max_followups]
 
-        # Should never reach here (fallback handler handles everything)
-        raise RuntimeError(f"No handler found for intent: {intent}")
+        return result
 
     def add_handler(self, handler: IntentHandler, position: int | None = None):
         """
@@ -129,6 +172,7 @@ class AnswerSynthesizer:
             self.handlers.append(handler)
         else:
             self.handlers.insert(position, handler)
+        self._rebuild_index()
 
     def remove_handler(self, handler_class: type) -> bool:
         """
@@ -146,10 +190,27 @@ class AnswerSynthesizer:
                 if isinstance(handler, FallbackHandler):
                     return False
                 self.handlers.pop(i)
+                self._rebuild_index()
                 return True
         return False
 
 
+_DEFAULT_SYNTHESIZER: AnswerSynthesizer | None = None
+
+
+def default_synthesizer() -> AnswerSynthesizer:
+    """
+    Shared synthesizer with the default handler registry.
+
+    Handlers are stateless, so the registry is built once per process
+    instead of on every synthesize_answer call.
+    """
+    global _DEFAULT_SYNTHESIZER
+    if _DEFAULT_SYNTHESIZER is None:
+        _DEFAULT_SYNTHESIZER = AnswerSynthesizer()
+    return _DEFAULT_SYNTHESIZER
+
+
 # Backward compatibility wrapper
 def synthesize_answer(
     inp: AnswerInput,
@@ -160,5 +221,4 @@ def synthesize_answer(
 
     Delegates to the new divide-and-conquer synthesizer.
     """
-    synthesizer = AnswerSynthesizer()
-    return synthesizer.synthesize(inp, bounds=bounds)
+    return default_synthesizer().synthesize(inp, bounds=bounds)
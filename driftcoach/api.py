@@ -12,6 +12,7 @@ import sys
 import uuid
 import json
 import hashlib
+import heapq
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional, Set
@@ -479,9 +480,14 @@ def _build_summary(buckets: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
             summary["bias_flags"][axis] = False
             continue
 
-        sorted_counts = sorted(axis_buckets.values(), reverse=True)
-        top1 = sorted_counts[0]
-        top3 = sum(sorted_counts[:3])
+        # only the three largest counts matter; wide axes (opponent) need no full sort
+        if len(axis_buckets) <= 3:
+            top1 = max(axis_buckets.values())
+            top3 = total
+        else:
+            top_counts = heapq.nlargest(3, axis_buckets.values())
+            top1 = top_counts[0]
+            top3 = sum(top_counts)
         summary["concentration"][axis] = {
             "top1": round(top1 / total, 4),
             "top3": round(top3 / total, 4),
@@ -685,14 +691,10 @@ def _build_mining_explanation_block(narrative: Dict[str, Any]) -> str:
 
 
 def _axes_with_bias(summary: Dict[str, Any]) -> List[str]:
-    axes: List[str] = []
+    # bias_flags[axis] is the unrounded top1 share >= 0.6, which implies the
+    # rounded concentration top1 >= 0.6, so the concentration check alone decides.
     conc = summary.get("concentration", {}) or {}
-    bias = summary.get("bias_flags", {}) or {}
-    for axis, stats in conc.items():
-        top1 = stats.get("top1", 0.0)
-        if top1 >= 0.6 or bias.get(axis):
-            axes.append(axis)
-    return axes
+    return [axis for axis, stats in conc.items() if stats.get("top1", 0.0) >= 0.6]
 
 
 def _ai_compose_answer(summary: Dict[str, Any], buckets: Dict[str, Dict[str, int]], coach_query: str) -> str:
@@ -2374,6 +2376,9 @@ def coach_query(body: CoachQuery):
             ft = f.get("fact_type")
             if not ft:
                 continue
+            # interned so handler lookups by literal fact type hit the identity fast path
+            if type(ft) is str:
+                ft = sys.intern(ft)
             facts_by_type.setdefault(ft, []).append(f)
         context_meta["file_facts"] = file_facts
 
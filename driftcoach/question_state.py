@@ -45,7 +45,7 @@ class FactRef:
         return FactRef(id=fact_id, fact_type=fact_type, scope=scope, summary=summary, confidence=conf)
 
 
-@dataclass
+@dataclass(slots=True)
 class DerivedFinding:
     id: str
     type: str
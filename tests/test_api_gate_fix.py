@@ -73,7 +73,7 @@ def test_decision_mapper_precedence():
         "❌ FAILED: DecisionMapper claim was not used!"
 
     print(f"\n📊 Result:")
-    print(f"   Decision path: {decision.decision_path.value}")
+    print(f"   Decision path: {decision.decision_path.value_str}")
     print(f"   Verdict: {decision.verdict}")
     print(f"   Confidence: {decision.confidence}")
     print(f"   Assistant message: {payload['assistant_message'][:80]}...")
@@ -60,7 +60,7 @@ def test_api_decision_flow():
     )
 
     print(f"\n📊 Decision Result:")
-    print(f"   Path: {decision.decision_path.value}")
+    print(f"   Path: {decision.decision_path.value_str}")
     print(f"   Claim: {decision.claim}")
     print(f"   Verdict: {decision.verdict}")
     print(f"   Confidence: {decision.confidence}")
@@ -120,7 +120,7 @@ def test_complete_evidence_flow():
     )
 
     print(f"\n📊 Decision Result:")
-    print(f"   Path: {decision.decision_path.value}")
+    print(f"   Path: {decision.decision_path.value_str}")
     print(f"   Confidence: {decision.confidence}")
     print(f"   Caveats: {decision.caveats}")
 
@@ -158,7 +158,7 @@ def test_no_evidence_flow():
     )
 
     print(f"\n📊 Decision Result:")
-    print(f"   Path: {decision.decision_path.value}")
+    print(f"   Path: {decision.decision_path.value_str}")
     print(f"   Claim: {decision.claim}")
 
     assert decision.decision_path == DecisionPath.REJECT
@@ -89,6 +89,60 @@ class TestBudgetController:
         # Should NOT stop (premature)
         assert controller.should_continue(state, target) == True
 
+    def test_should_stop_when_marginal_gain_exhausted(self):
+        """With ω set, stop once every gain in the window is <= ω·Δ₁, before ε-convergence."""
+        target = ConfidenceTarget(target_confidence=0.9, gain_ratio_omega=0.5)
+        controller = BudgetController()
+
+        # Δ₁ = 0.4, then Δ = 0.15, 0.15 <= 0.5 * 0.4 (but > ε, so not converged)
+        state = create_initial_state(initial_confidence=0.0, budget=5)
+        state.update_confidence(0.4)
+        state.update_confidence(0.55)
+        state.facts_mined = 2
+        # only one flattened gain so far → continue
+        assert controller.should_continue(state, target) == True
+
+        state.update_confidence(0.7)
+        state.facts_mined = 3
+        assert controller._is_converged(state, target) == False
+        assert controller.should_continue(state, target) == False
+
+    def test_marginal_gain_rule_is_opt_in_and_ignores_plateaus(self):
+        """Rule 4 is off by default, and a zero-gain plateau is not exhaustion."""
+        controller = BudgetController()
+
+        state = create_initial_state(initial_confidence=0.0, budget=5)
+        for value in (0.4, 0.55, 0.7):
+            state.update_confidence(value)
+        state.facts_mined = 3
+        assert controller.should_continue(state, create_default_target(target_confidence=0.9)) == True
+
+        # Step-shaped confidence: Δ₁ = 0.6, then a plateau
+        target = ConfidenceTarget(target_confidence=0.9, gain_ratio_omega=0.5, convergence_epsilon=0.01)
+        state = create_initial_state(initial_confidence=0.0, budget=5, convergence_epsilon=0.01)
+        state.update_confidence(0.6)
+        state.update_confidence(0.6)
+        state.facts_mined = 2
+        assert controller._is_marginal_gain_exhausted(state, target) == False
+
+    def test_converged_window_larger_than_default_history(self):
+        """A wide window converges when the state is sized for it, and never otherwise."""
+        target = ConfidenceTarget(target_confidence=0.99, convergence_window=20, convergence_epsilon=0.01)
+        controller = BudgetController()
+
+        # State tracks a different ε, so the history scan is used
+        state = create_initial_state(initial_confidence=0.5, budget=50, convergence_window=20)
+        short = create_initial_state(initial_confidence=0.5, budget=50)
+        sized = create_initial_state(initial_confidence=0.5, budget=50, target=target)
+        assert sized.confidence_history.maxlen >= 20
+        for i in range(1, 20):
+            for st in (state, short, sized):
+                st.update_confidence(0.5 + i * 0.001)
+        assert controller._is_converged(state, target) == True
+        assert controller._is_converged(sized, target) == True
+        # a 16-value history can never hold the 20-value window
+        assert controller._is_converged(short, target) == False
+
     def test_confidence_calculation_in_handler(self):
         """Test confidence calculation in RiskAssessmentHandler."""
         from driftcoach.analysis.intent_handlers import RiskAssessmentHandler
@@ -171,6 +225,22 @@ class TestBudgetControllerIntegration:
         assert result.claim == "这是一场高风险对局"
         assert result.confidence == 0.9
 
+    def test_risk_handler_mines_baseline_fact_count(self):
+        """Confidence plateaus between table steps must not cut mining short."""
+        from driftcoach.analysis.intent_handlers import RiskAssessmentHandler
+
+        handler = RiskAssessmentHandler()
+        hrs_pool = [{"fact_type": "HIGH_RISK_SEQUENCE", "round_range": [1, 3]}]
+        for swings in (2, 3):
+            swing_pool = [{"fact_type": "ROUND_SWING", "round": r} for r in range(swings)]
+            state = create_initial_state(initial_confidence=0.0, budget=10)
+            mined_hrs, mined_swings, _ = handler._mine_with_budget(
+                handler._controller, state, handler._target, hrs_pool, swing_pool, []
+            )
+            # 0.6 → 0.6 → 0.6: Rule 3 stops after the third fact, as before Rule 4
+            assert state.facts_mined == 3
+            assert (len(mined_hrs), len(mined_swings)) == (1, 2)
+
     def test_risk_handler_with_insufficient_facts(self):
         """Test RiskAssessmentHandler with BudgetController uses degraded path."""
         from driftcoach.analysis.intent_handlers import RiskAssessmentHandler
@@ -63,7 +63,7 @@ def test_decision_path_selection():
         facts_empty
     )
     assert path == DecisionPath.REJECT
-    print(f"✅ No facts → {path.value}")
+    print(f"✅ No facts → {path.value_str}")
 
     # High uncertainty → REJECT
     facts_some = {"HIGH_RISK_SEQUENCE": [{"round": 1}]}
@@ -72,7 +72,7 @@ def test_decision_path_selection():
         facts_some
     )
     assert path == DecisionPath.REJECT
-    print(f"✅ High uncertainty (0.85) → {path.value}")
+    print(f"✅ High uncertainty (0.85) → {path.value_str}")
 
     # Medium uncertainty + some facts → DEGRADED
     path = mapper._choose_decision_path(
@@ -80,7 +80,7 @@ def test_decision_path_selection():
         facts_some
     )
     assert path == DecisionPath.DEGRADED
-    print(f"✅ Medium uncertainty (0.5) + facts → {path.value}")
+    print(f"✅ Medium uncertainty (0.5) + facts → {path.value_str}")
 
     # Low uncertainty → STANDARD
     path = mapper._choose_decision_path(
@@ -88,7 +88,11 @@ def test_decision_path_selection():
         {"HIGH_RISK_SEQUENCE": [{"round": i} for i in range(5)]}
     )
     assert path == DecisionPath.STANDARD
-    print(f"✅ Low uncertainty (0.2) → {path.value}")
+    print(f"✅ Low uncertainty (0.2) → {path.value_str}")
+
+    # Every path is truthy and serializes to its lowercase name
+    assert all(DecisionPath)
+    assert [p.value_str for p in DecisionPath] == ["standard", "degraded", "reject"]
 
 
 def test_degraded_decision_generation():
@@ -121,7 +125,7 @@ def test_degraded_decision_generation():
     assert "有限证据" in decision.claim or "初步分析" in decision.claim
 
     print(f"✅ Degraded decision:")
-    print(f"   Path: {decision.decision_path.value}")
+    print(f"   Path: {decision.decision_path.value_str}")
     print(f"   Claim: {decision.claim}")
     print(f"   Confidence: {decision.confidence}")
     print(f"   Caveats: {decision.caveats}")
@@ -152,7 +156,7 @@ def test_rejection_when_no_evidence():
     assert "完全无可用数据" in decision.claim or "无法分析" in decision.claim
 
     print(f"✅ Rejection (no evidence):")
-    print(f"   Path: {decision.decision_path.value}")
+    print(f"   Path: {decision.decision_path.value_str}")
     print(f"   Claim: {decision.claim}")
 
 
@@ -184,7 +188,7 @@ def test_standard_decision_with_good_evidence():
     assert len(decision.caveats) == 0  # No caveats for standard
 
     print(f"✅ Standard decision:")
-    print(f"   Path: {decision.decision_path.value}")
+    print(f"   Path: {decision.decision_path.value_str}")
     print(f"   Confidence: {decision.confidence}")
     print(f"   Caveats: {decision.caveats}")
 
@@ -243,7 +247,7 @@ def test_key_principle_never_refuse_when_evidence_exists():
     assert decision.confidence > 0
 
     print(f"✅ Key principle test: NEVER refuse when evidence exists")
-    print(f"   Path: {decision.decision_path.value} (not REJECT)")
+    print(f"   Path: {decision.decision_path.value_str} (not REJECT)")
     print(f"   Claim: {decision.claim}")
 
 
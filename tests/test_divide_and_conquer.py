@@ -129,6 +129,24 @@ def test_momentum_analysis_no_swings():
     assert "未发现" in result.claim or "没有" in result.claim
 
 
+def test_risk_assessment_no_facts_still_logs_metrics(caplog):
+    """The no-facts shortcut must not skip RiskAssessmentHandler's metrics logging."""
+    inp = AnswerInput(
+        question="这场比赛风险高吗？",
+        intent="RISK_ASSESSMENT",
+        required_facts=["HIGH_RISK_SEQUENCE"],
+        facts={},
+        series_id="series-1",
+    )
+
+    with caplog.at_level("WARNING", logger="driftcoach.analysis.intent_handlers"):
+        result = AnswerSynthesizer().synthesize(inp)
+
+    assert result.verdict == RiskAssessmentHandler.empty_answer[1]
+    assert "DEBUG_ENV" in caplog.text
+    assert "BC_METRICS" in caplog.text or "SHADOW_METRICS" in caplog.text
+
+
 def test_bounds_enforcement():
     """Test that bounds are enforced on outputs."""
     inp = AnswerInput(
@@ -243,6 +261,32 @@ def test_handler_independence():
     assert isinstance(result.verdict, str)
 
 
+def test_handler_index_follows_registry_order():
+    """Indexed routing keeps first-match-wins when handlers are added or removed."""
+    synthesizer = AnswerSynthesizer()
+    assert isinstance(synthesizer._route("MOMENTUM_SHIFT"), MomentumAnalysisHandler)
+
+    class OverrideRisk(RiskAssessmentHandler):
+        pass
+
+    override = OverrideRisk()
+    synthesizer.add_handler(override, position=0)
+    assert synthesizer._route("RISK_ASSESSMENT") is override
+
+    assert synthesizer.remove_handler(OverrideRisk) is True
+    assert type(synthesizer._route("RISK_ASSESSMENT")) is RiskAssessmentHandler
+    assert synthesizer._route("UNKNOWN_INTENT") is synthesizer.handlers[-1]
+
+    class ClaimsEconomy(MomentumAnalysisHandler):
+        def can_handle(self, intent: str) -> bool:
+            return intent.startswith("ECONOMIC")
+
+    custom = ClaimsEconomy()
+    synthesizer.add_handler(custom, position=0)
+    assert synthesizer._route("ECONOMIC_COUNTERFACTUAL") is custom
+    assert isinstance(synthesizer._route("RISK_ASSESSMENT"), RiskAssessmentHandler)
+
+
 if __name__ == "__main__":
     print("Testing divide-and-conquer synthesizer...")
 
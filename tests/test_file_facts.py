@@ -0,0 +1,106 @@
+"""
+Tests for compress_events_to_facts economy facts and the loadout-ratio sweep.
+
+_loadout_ratios switches to a NumPy path once a team has
+_ECON_VECTORIZE_MIN_ROUNDS rows; both paths must agree, including on missing
+(None) and zero loadouts.
+"""
+
+import random
+
+import pytest
+
+from driftcoach.adapters.grid.file_download_client import RawEvent
+from driftcoach.analysis import file_facts
+from driftcoach.analysis.file_facts import _loadout_ratios, compress_events_to_facts
+
+
+def _econ(rnd, team, loadout, players=()):
+    payload = {"roundNumber": rnd, "teamId": team, "loadoutValue": loadout}
+    if players:
+        payload["players"] = [{"id": pid, "loadoutValue": lv} for pid, lv in players]
+    return RawEvent("ECONOMY_SNAPSHOT", payload, None, rnd, None, None, None)
+
+
+def _round_end(rnd, winner):
+    return RawEvent("ROUND_END", {"winner": winner}, None, rnd, None, None, None)
+
+
+def _series_events():
+    """Team A: full buys, a three-round eco collapse with a force buy, then a recovery."""
+    return [
+        _econ(1, "A", 4000, [("p1", 1000), ("p2", 1000)]),
+        _econ(2, "A", 4000),
+        _econ(3, "A", 1000),
+        _econ(4, "A", 1000, [("p1", 900), ("p2", 900)]),
+        _round_end(4, "A"),
+        _econ(5, "A", 1200),
+        _econ(6, "A", 4000),
+    ]
+
+
+def _by_type(facts, fact_type):
+    return [f for f in facts if f["fact_type"] == fact_type]
+
+
+def _scalar_and_vector(monkeypatch, loadouts):
+    monkeypatch.setattr(file_facts, "_ECON_VECTORIZE_MIN_ROUNDS", len(loadouts) + 1)
+    scalar = _loadout_ratios(loadouts)
+    monkeypatch.setattr(file_facts, "_ECON_VECTORIZE_MIN_ROUNDS", 0)
+    vector = _loadout_ratios(loadouts)
+    return scalar, vector
+
+
+@pytest.mark.parametrize(
+    "loadouts",
+    [
+        [None, None, 3000.0, 0.0, None, 2500.0, 0.0, 0.0, 4000.0, 1000.0],
+        [0.0, 0.0, 100.0, None, 50.0],
+        [None, None, None],
+        [4000.0, 3800.0, 1000.0, 900.0, 1200.0, 4100.0, 4100.0, 3900.0],
+        [],
+    ],
+)
+def test_loadout_ratios_vector_path_matches_scalar(monkeypatch, loadouts):
+    scalar, vector = _scalar_and_vector(monkeypatch, loadouts)
+    assert vector == scalar
+
+
+def test_loadout_ratios_vector_path_matches_scalar_random(monkeypatch):
+    rng = random.Random(7)
+    for _ in range(200):
+        n = rng.randint(1, 90)
+        loadouts = [rng.choice([None, 0.0, float(rng.randint(0, 6000))]) for _ in range(n)]
+        scalar, vector = _scalar_and_vector(monkeypatch, loadouts)
+        assert vector == scalar, loadouts
+
+
+def test_full_buy_rounds():
+    facts = compress_events_to_facts("s1", _series_events())
+    full_buys = _by_type(facts, "FULL_BUY_ROUND")
+    assert [f["round"] for f in full_buys] == [1, 2, 6]
+    assert all(f["team_id"] == "A" and f["loadout_ratio"] >= 0.9 for f in full_buys)
+
+
+def test_force_buy_round():
+    facts = compress_events_to_facts("s1", _series_events())
+    (force,) = _by_type(facts, "FORCE_BUY_ROUND")
+    assert force["round"] == 4
+    assert force["team_id"] == "A"
+    assert force["result"] == "SUCCESS"
+    assert force["economy_context"]["players_full_buy_count"] == 2
+    assert force["economy_context"]["team_loadout_ratio"] == pytest.approx(0.25)
+
+
+def test_eco_collapse_sequence():
+    facts = compress_events_to_facts("s1", _series_events())
+    (collapse,) = _by_type(facts, "ECO_COLLAPSE_SEQUENCE")
+    assert collapse["rounds"] == [3, 4, 5]
+    assert collapse["round_range"] == [3, 5]
+    assert collapse["severity"] == "HIGH"
+
+
+def test_economy_facts_same_on_vector_path(monkeypatch):
+    expected = compress_events_to_facts("s1", _series_events())
+    monkeypatch.setattr(file_facts, "_ECON_VECTORIZE_MIN_ROUNDS", 0)
+    assert compress_events_to_facts("s1", _series_events()) == expected
@@ -0,0 +1,127 @@
+"""
+Tests for automatic persisted queries (APQ) in GridClient.run_query.
+
+Every POST must go through the rate/run budgets; a PersistedQueryNotFound or
+PersistedQueryNotSupported answer costs at most one extra, budgeted call.
+"""
+
+import json
+
+import pytest
+import requests
+
+from driftcoach.adapters.grid import client as grid_client
+from driftcoach.adapters.grid.client import GridClient, clear_response_cache
+from driftcoach.adapters.grid.rate_budget import (
+    GridRunBudgetExceeded,
+    clear_run_budget,
+    get_debug_counters,
+    reset_grid_controls,
+    set_run_budget,
+)
+
+QUERY = "query Q($id: ID!) { series(id: $id) { id } }"
+OK = {"data": {"series": {"id": "1"}}}
+NOT_FOUND = {"errors": [{"message": "PersistedQueryNotFound"}]}
+NOT_SUPPORTED = {"errors": [{"message": "PersistedQueryNotSupported"}]}
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict):
+        self._payload = payload
+        self.status_code = 200
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        return None
+
+
+@pytest.fixture
+def grid(monkeypatch):
+    """Fresh controls and caches; returns (client, sent bodies, scripted replies)."""
+    monkeypatch.setenv("GRID_APQ", "1")
+    monkeypatch.delenv("GRID_FAULT_MODE", raising=False)
+    reset_grid_controls()
+    clear_response_cache()
+    sent = []
+    replies = []
+
+    def _fake_post(url, json=None, headers=None, timeout=30):
+        sent.append(json)
+        return _FakeResponse(replies.pop(0))
+
+    monkeypatch.setattr(requests, "post", _fake_post)
+    yield GridClient(api_key="test"), sent, replies
+    clear_run_budget()
+    reset_grid_controls()
+    clear_response_cache()
+
+
+def _register(client, replies):
+    replies.append(OK)
+    client.run_query(QUERY, {"id": "0"})
+
+
+def test_apq_disabled_by_default(grid, monkeypatch):
+    client, sent, replies = grid
+    monkeypatch.delenv("GRID_APQ")
+    replies.append(OK)
+
+    assert client.run_query(QUERY, {"id": "1"}) == OK
+    assert sent == [{"variables": {"id": "1"}, "query": QUERY}]
+
+
+def test_apq_hit_sends_hash_only(grid):
+    client, sent, replies = grid
+    _register(client, replies)
+    replies.append(OK)
+
+    assert client.run_query(QUERY, {"id": "1"}) == OK
+    body = sent[-1]
+    assert "query" not in body
+    assert body["extensions"]["persistedQuery"]["sha256Hash"] == grid_client._query_hash(QUERY)
+    assert len(sent) == 2
+
+
+def test_apq_not_found_resends_full_query_once_with_budget(grid):
+    client, sent, replies = grid
+    _register(client, replies)
+    set_run_budget(2)
+    replies.extend([NOT_FOUND, OK])
+
+    assert client.run_query(QUERY, {"id": "1"}) == OK
+    assert len(sent) == 3
+    assert sent[-1]["query"] == QUERY
+    assert "persistedQuery" in sent[-1]["extensions"]
+    assert get_debug_counters()["calls_sent"] == 3
+    # both POSTs of this call were charged against the run budget
+    with pytest.raises(GridRunBudgetExceeded):
+        client.run_query(QUERY, {"id": "2"})
+
+
+def test_apq_not_supported_disables_apq(grid):
+    client, sent, replies = grid
+    replies.extend([NOT_SUPPORTED, OK])
+
+    assert client.run_query(QUERY, {"id": "1"}) == OK
+    assert len(sent) == 2
+    assert "extensions" not in sent[-1]
+    assert sent[-1]["query"] == QUERY
+
+    replies.append(OK)
+    client.run_query(QUERY, {"id": "2"})
+    assert "extensions" not in sent[-1]
+
+
+def test_apq_resend_denied_when_run_budget_exhausted(grid):
+    client, sent, replies = grid
+    _register(client, replies)
+    set_run_budget(1)
+    replies.append(NOT_FOUND)
+
+    with pytest.raises(GridRunBudgetExceeded):
+        client.run_query(QUERY, {"id": "1"})
+    assert len(sent) == 2